@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import os
 
 from celery import Celery
@@ -9,20 +10,23 @@ from celery.app.task import Task
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
+logger = logging.getLogger(__name__)
+
 celery_app: Celery = Celery("config")
+# Модули с задачами берутся из settings.CELERY_IMPORTS вместо autodiscover_tasks(),
+# чтобы воркер не обходил все INSTALLED_APPS при старте.
 celery_app.config_from_object("django.conf:settings", namespace="CELERY")
-celery_app.autodiscover_tasks()
 
 
 @celery_app.task(bind=True)
 def debug_task(self: Task) -> None:
     """
-    Выводит информацию о выполнении задачи.
+    Логирует информацию о выполнении задачи.
 
     Args:
         self (Task): Текущая задача.
     """
-    print(f"Request: {self.request!r}")
+    logger.debug("Request: %r", self.request)
 
 
 __all__ = ["celery_app"]
\ No newline at end of file
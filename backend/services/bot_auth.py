@@ -2,17 +2,195 @@
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, NamedTuple
 
 import jwt
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from rest_framework.authentication import BaseAuthentication, get_authorization_header
 from rest_framework.exceptions import AuthenticationFailed
 
 from users.models import User
 
+_JWT_OPTIONS: Final[dict[str, Any]] = {"require": ["iss", "aud", "exp", "iat"]}
+
+_BEARER_KEYWORD: Final[bytes] = b"Bearer"
+_BEARER_PREFIX: Final[bytes] = _BEARER_KEYWORD + b" "
+
+_CLAIMS_CACHE_MAX_SIZE: Final[int] = 1024
+_CLAIMS_CACHE_MAX_TTL_SECONDS: Final[int] = 300
+
+
+class _VerifiedToken(NamedTuple):
+    """
+    Результат проверки JWT-токена, который хранится в кэше.
+
+    Attributes:
+        claims (Mapping[str, Any]): Утверждения токена (только для чтения).
+        scopes (frozenset[str]): Области действия из поля "scope", разобранные один раз.
+    """
+
+    claims: Mapping[str, Any]
+    scopes: frozenset[str]
+
+
+_claims_cache: OrderedDict[bytes, tuple[float, _VerifiedToken]] = OrderedDict()
+_claims_cache_lock = threading.Lock()
+
+
+class _JWTSettings(NamedTuple):
+    """
+    Параметры проверки JWT-токенов бот-сервиса.
+
+    Attributes:
+        public_key (Any): Подготовленный ключ проверки подписи или пустая строка, если ключ не задан.
+        algorithms (list[str]): Допустимые алгоритмы подписи.
+        audience (str): Ожидаемое значение поля "aud".
+        issuer (str): Ожидаемое значение поля "iss".
+        leeway (int): Допуск по времени в секундах.
+        scope (str): Требуемая область действия.
+    """
+
+    public_key: Any
+    algorithms: list[str]
+    audience: str
+    issuer: str
+    leeway: int
+    scope: str
+
+
+@lru_cache(maxsize=1)
+def _jwt_settings() -> _JWTSettings:
+    """
+    Считывает параметры проверки JWT из настроек Django один раз за жизнь процесса.
+
+    PEM-ключ сразу разбирается алгоритмом PyJWT, поэтому `jwt.decode` получает
+    готовый объект ключа и не разбирает PEM на каждой проверке.
+
+    Returns:
+        _JWTSettings: Параметры проверки JWT-токенов.
+    """
+    public_key = getattr(settings, "BOT_JWT_PUBLIC_KEY", "")
+    if public_key:
+        public_key = jwt.get_algorithm_by_name(settings.BOT_JWT_ALG).prepare_key(public_key)
+    return _JWTSettings(
+        public_key=public_key,
+        algorithms=[settings.BOT_JWT_ALG],
+        audience=settings.BOT_JWT_AUD,
+        issuer=settings.BOT_JWT_ISS,
+        leeway=settings.BOT_JWT_LEEWAY,
+        scope=settings.BOT_JWT_SCOPE,
+    )
+
+
+@receiver(setting_changed)
+def _reset_jwt_settings(*, setting: str, **_: Any) -> None:
+    """
+    Сбрасывает закэшированные параметры JWT и проверенные токены при изменении настроек BOT_JWT_*.
+
+    Настройки меняются, например, через `override_settings` в тестах.
+
+    Args:
+        setting (str): Имя изменённой настройки.
+        **_ (Any): Остальные аргументы сигнала.
+    """
+    if setting.startswith("BOT_JWT_"):
+        _jwt_settings.cache_clear()
+        with _claims_cache_lock:
+            _claims_cache.clear()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """
+    Вычисляет ключ кэша для JWT-токена.
+
+    Args:
+        token (str): Исходная строка токена.
+
+    Returns:
+        bytes: Короткий дайджест токена.
+    """
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def _get_cached_claims(key: bytes) -> _VerifiedToken | None:
+    """
+    Возвращает ранее проверенные утверждения токена, если запись ещё актуальна.
+
+    Args:
+        key (bytes): Ключ кэша токена.
+
+    Returns:
+        _VerifiedToken | None: Утверждения и области действия токена или None,
+        если записи нет или она устарела.
+    """
+    with _claims_cache_lock:
+        entry = _claims_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, verified = entry
+        if expires_at <= time.time():
+            del _claims_cache[key]
+            return None
+        _claims_cache.move_to_end(key)
+        return verified
+
+
+def _store_cached_claims(key: bytes, verified: _VerifiedToken, *, leeway: int) -> None:
+    """
+    Сохраняет утверждения успешно проверенного токена в кэш.
+
+    Запись живёт до `exp - leeway`, но не дольше `_CLAIMS_CACHE_MAX_TTL_SECONDS`.
+    Одни и те же утверждения отдаются всем запросам с этим токеном, поэтому
+    сохранять нужно неизменяемое представление (`MappingProxyType`).
+
+    Args:
+        key (bytes): Ключ кэша токена.
+        verified (_VerifiedToken): Проверенные утверждения и области действия токена.
+        leeway (int): Допуск по времени в секундах.
+    """
+    now = time.time()
+    try:
+        expires_at = min(float(verified.claims["exp"]) - leeway, now + _CLAIMS_CACHE_MAX_TTL_SECONDS)
+    except (KeyError, TypeError, ValueError):
+        return
+    if expires_at <= now:
+        return
+    with _claims_cache_lock:
+        _claims_cache[key] = (expires_at, verified)
+        _claims_cache.move_to_end(key)
+        while len(_claims_cache) > _CLAIMS_CACHE_MAX_SIZE:
+            _claims_cache.popitem(last=False)
+
+
+class BotAuth:
+    """
+    Результат успешной аутентификации бот-сервиса, сохраняемый в `request.auth`.
+
+    Attributes:
+        is_bot (bool): Признак аутентификации бот-сервиса, всегда True.
+        claims (Mapping[str, Any]): Проверенные утверждения JWT-токена (только для чтения).
+        scopes (frozenset[str]): Области действия токена.
+    """
+
+    __slots__ = ("claims", "scopes")
+
+    is_bot = True
+
+    def __init__(self, claims: Mapping[str, Any], scopes: frozenset[str]) -> None:
+        self.claims = claims
+        self.scopes = scopes
+
 
 class BotServiceJWTAuthentication(BaseAuthentication):
     """
@@ -37,32 +215,38 @@ class BotServiceJWTAuthentication(BaseAuthentication):
             request: HTTP-запрос, содержащий заголовок авторизации и, возможно, идентификацию пользователя.
 
         Returns:
-            tuple: Возвращает кортеж из пользователя (AnonymousUser или User) и объекта auth_info.
+            tuple: Возвращает кортеж из пользователя (AnonymousUser или User) и объекта BotAuth.
 
         Raises:
             AuthenticationFailed: Если отсутствует заголовок авторизации, токен не соответствует формату Bearer,
             предоставлен некорректный токен, указан недостаточный scope или пользователь не найден.
         """
-        auth = get_authorization_header(request).split()
-        if not auth or auth[0].lower() != b"bearer":
+        header = get_authorization_header(request)
+        if not header.startswith(_BEARER_PREFIX):
+            if header.rstrip() == _BEARER_KEYWORD:
+                raise AuthenticationFailed(_("Invalid Authorization header. No credentials provided."))
             return None
 
-        if len(auth) == 1:
+        token_bytes = header[len(_BEARER_PREFIX):].strip()
+        if not token_bytes:
             raise AuthenticationFailed(_("Invalid Authorization header. No credentials provided."))
-        if len(auth) > 2:
+        if b" " in token_bytes:
             raise AuthenticationFailed(_("Invalid Authorization header. Token string should not contain spaces."))
 
-        token = auth[1].decode("utf-8")
-        claims = self._decode_and_validate(token)
+        try:
+            token = token_bytes.decode("ascii")
+        except UnicodeDecodeError:
+            raise AuthenticationFailed(_("Invalid Authorization header. Token string should be ASCII."))
+        claims, scopes = self._decode_and_validate(token)
 
-        if not self._has_scope(claims, required=settings.BOT_JWT_SCOPE):
+        if _jwt_settings().scope not in scopes:
             raise AuthenticationFailed(_("Insufficient scope"))
 
         tg_id_hdr = request.headers.get("X-Act-As-User")
         tg_id_claim = claims.get("tg_id")
         act_as = tg_id_hdr or tg_id_claim
 
-        auth_info = {"is_bot": True, "claims": claims}
+        auth_info = BotAuth(claims, scopes)
 
         if act_as is None:
             return AnonymousUser(), auth_info
@@ -72,65 +256,78 @@ class BotServiceJWTAuthentication(BaseAuthentication):
         except (ValueError, TypeError):
             raise AuthenticationFailed(_("Invalid X-Act-As-User"))
 
-        user = User.objects.filter(telegram_user_id=tg_id_int, is_active=True).first()
+        user = (
+            User.objects.only("id", "telegram_user_id", "is_active", "username")
+            .filter(telegram_user_id=tg_id_int, is_active=True)
+            .first()
+        )
         if not user:
             raise AuthenticationFailed(_("Unknown user (call /api/bot/register/ first)"))
         return user, auth_info
 
-    def _decode_and_validate(self, token: str) -> dict[str, Any]:
+    def _decode_and_validate(self, token: str) -> _VerifiedToken:
         """
         Декодирует и валидирует JWT-токен.
 
+        Результаты успешной проверки кэшируются по дайджесту токена, поэтому
+        повторные запросы с тем же токеном не выполняют проверку подписи заново.
+
         Args:
             token (str): JWT-токен, который требуется декодировать и проверить.
 
         Returns:
-            dict[str, Any]: Расшифрованные данные из токена.
+            _VerifiedToken: Расшифрованные данные из токена (только для чтения)
+            и множество его областей действия.
 
         Raises:
             AuthenticationFailed: Если ключ BOT_JWT_PUBLIC_KEY не установлен,
                 токен истек, либо недействителен.
         """
-        pubkey = getattr(settings, "BOT_JWT_PUBLIC_KEY", "")
-        if not pubkey:
+        jwt_settings = _jwt_settings()
+        if not jwt_settings.public_key:
             raise AuthenticationFailed(_("Server misconfiguration: BOT_JWT_PUBLIC_KEY is not set"))
 
+        cache_key = _token_cache_key(token)
+        cached = _get_cached_claims(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             claims = jwt.decode(
                 token,
-                pubkey,
-                algorithms=[settings.BOT_JWT_ALG],
-                audience=settings.BOT_JWT_AUD,
-                issuer=settings.BOT_JWT_ISS,
-                leeway=settings.BOT_JWT_LEEWAY,
-                options={"require": ["iss", "aud", "exp", "iat"]},
+                jwt_settings.public_key,
+                algorithms=jwt_settings.algorithms,
+                audience=jwt_settings.audience,
+                issuer=jwt_settings.issuer,
+                leeway=jwt_settings.leeway,
+                options=_JWT_OPTIONS,
             )
         except jwt.ExpiredSignatureError:
             raise AuthenticationFailed(_("Token expired"))
         except jwt.InvalidTokenError as e:
             raise AuthenticationFailed(_(f"Invalid token: {e}"))
-        return claims
+        verified = _VerifiedToken(MappingProxyType(claims), self._normalize_scope(claims.get("scope")))
+        _store_cached_claims(cache_key, verified, leeway=jwt_settings.leeway)
+        return verified
 
     @staticmethod
-    def _has_scope(claims: dict[str, Any], *, required: str) -> bool:
+    def _normalize_scope(scope: Any) -> frozenset[str]:
         """
-        Проверяет наличие указанной области действия (scope) в переданных данных утверждений.
+        Приводит значение поля "scope" к множеству областей действия.
 
         Args:
-            claims (dict[str, Any]): Данные утверждений, содержащие информацию о доступах.
-            required (str): Необходимая область действия (scope), которую нужно проверить.
+            scope (Any): Значение поля "scope" из токена: строка, разделённая пробелами, или коллекция.
 
         Returns:
-            bool: True, если указанная область действия есть в утверждениях, иначе False.
+            frozenset[str]: Множество областей действия; пустое, если формат не поддерживается.
         """
-        scope = claims.get("scope")
         if not scope:
-            return False
+            return frozenset()
         if isinstance(scope, str):
-            return required in scope.split()
+            return frozenset(scope.split())
         if isinstance(scope, (list, tuple, set)):
-            return required in scope
-        return False
+            return frozenset(scope)
+        return frozenset()
 
     def authenticate_header(self, request) -> str:
         """
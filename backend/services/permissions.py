@@ -10,7 +10,7 @@ class IsBotService(BasePermission):
     Определяет права доступа для проверки аутентификации сервисов-ботов.
 
     Этот класс используется для ограничения доступа только для аутентифицированных
-    сервисов-ботов. Проверяет, предоставлено ли правильное значение в поле "is_bot".
+    сервисов-ботов. Проверяет признак `is_bot` объекта `request.auth`.
 
     Attributes:
         message (str): Сообщение для случаев, когда доступ запрещен.
@@ -18,7 +18,4 @@ class IsBotService(BasePermission):
     message = "Bot service authentication required."
 
     def has_permission(self, request, view) -> bool:
-        auth = getattr(request, "auth", None)
-        if not isinstance(auth, dict):
-            return False
-        return bool(auth.get("is_bot"))
+        return getattr(request.auth, "is_bot", False) is True
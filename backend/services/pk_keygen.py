@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import itertools
 import os
-import threading
 import time
 from typing import Final
 
 _BASE62_ALPHABET: Final[str] = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 _BASE: Final[int] = len(_BASE62_ALPHABET)
 _MAX_LEN: Final[int] = 26
+_DIGITS: Final[tuple[str, ...]] = tuple(_BASE62_ALPHABET)
+_PAIR_BASE: Final[int] = _BASE * _BASE
+_PAIRS: Final[tuple[str, ...]] = tuple(_DIGITS[i // _BASE] + _DIGITS[i % _BASE] for i in range(_PAIR_BASE))
 
-_lock = threading.Lock()
-_last_ms = 0
-_counter = 0
+_SEQ_BITS: Final[int] = 20
+_SEQ_MASK: Final[int] = (1 << _SEQ_BITS) - 1
+
+# next() у itertools.count атомарен под GIL, поэтому блокировка не нужна.
+_sequence = itertools.count()
 
 
 def _b62_encode(num: int) -> str:
@@ -21,7 +26,8 @@ def _b62_encode(num: int) -> str:
     Кодирует число в строку в формате base62.
 
     Функция принимает неотрицательное целое число и возвращает его строковое
-    представление в 62-ричной системе счисления.
+    представление в 62-ричной системе счисления. Число раскладывается сразу
+    по два разряда с помощью предвычисленной таблицы `_PAIRS`.
 
     Args:
         num (int): Неотрицательное целое число для конвертации.
@@ -34,14 +40,16 @@ def _b62_encode(num: int) -> str:
     """
     if num < 0:
         raise ValueError("num must be >= 0")
-    if num == 0:
-        return _BASE62_ALPHABET[0]
-    chars = []
+    if num < _BASE:
+        return _DIGITS[num]
+    pairs = []
     while num > 0:
-        num, rem = divmod(num, _BASE)
-        chars.append(_BASE62_ALPHABET[rem])
-    chars.reverse()
-    return "".join(chars)
+        num, rem = divmod(num, _PAIR_BASE)
+        pairs.append(_PAIRS[rem])
+    pairs.reverse()
+    encoded = "".join(pairs)
+    # Старшая пара может начинаться с незначащего нуля.
+    return encoded[1:] if encoded[0] == _DIGITS[0] else encoded
 
 
 def _now_ms() -> int:
@@ -51,7 +59,7 @@ def _now_ms() -> int:
     Returns:
         int: Текущее время в миллисекундах.
     """
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def _env_prefix() -> str:
@@ -70,10 +78,17 @@ def _env_prefix() -> str:
     return filtered
 
 
+# PK_PREFIX не меняется во время работы процесса, поэтому вычисляется один раз.
+_PREFIX: Final[str] = _env_prefix()
+
+
 def generate_pk(kind: str) -> str:
     """
     Генерирует уникальный ключ на основе переданного символа типа.
 
+    Метка времени в миллисекундах и порядковый номер упаковываются в одно число
+    `(ms << 20) | seq`, которое кодируется в base62 за один проход.
+
     Args:
         kind (str): Символ, определяющий тип ключа. Должен быть одним символом из алфавита base62.
 
@@ -89,18 +104,42 @@ def generate_pk(kind: str) -> str:
     if kind not in _BASE62_ALPHABET:
         raise ValueError("kind must be a base62 char")
 
-    prefix = _env_prefix()
-
-    with _lock:
-        global _last_ms, _counter
-        now_ms = _now_ms()
-        if now_ms == _last_ms:
-            _counter += 1
-        else:
-            _last_ms = now_ms
-            _counter = 0
-        ts62 = _b62_encode(now_ms)
-        cnt62 = _b62_encode(_counter)
+    seq = next(_sequence) & _SEQ_MASK
+    packed = (_now_ms() << _SEQ_BITS) | seq
 
-    key = f"{prefix}{kind}{ts62}{cnt62}"
+    key = f"{_PREFIX}{kind}{_b62_encode(packed)}"
     return key
+
+
+def generate_pks(kind: str, count: int) -> list[str]:
+    """
+    Генерирует несколько уникальных ключей за один вызов.
+
+    Предназначена для `bulk_create`: метка времени читается один раз, а каждому
+    ключу выдаётся свой порядковый номер из общего счётчика.
+
+    Args:
+        kind (str): Символ, определяющий тип ключа. Должен быть одним символом из алфавита base62.
+        count (int): Количество ключей.
+
+    Returns:
+        list[str]: Сгенерированные уникальные ключи.
+
+    Raises:
+        ValueError: Если `kind` пустой или длина параметра не равна 1.
+        ValueError: Если `kind` не является допустимым символом алфавита base62.
+        ValueError: Если `count` меньше 0.
+    """
+    if not kind or len(kind) != 1:
+        raise ValueError("kind must be exactly 1 char")
+    if kind not in _BASE62_ALPHABET:
+        raise ValueError("kind must be a base62 char")
+    if count < 0:
+        raise ValueError("count must be >= 0")
+
+    prefix = f"{_PREFIX}{kind}"
+    ts_bits = _now_ms() << _SEQ_BITS
+    return [
+        f"{prefix}{_b62_encode(ts_bits | (seq & _SEQ_MASK))}"
+        for seq in itertools.islice(_sequence, count)
+    ]
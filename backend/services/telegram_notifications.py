@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import hashlib
 import logging
+import random
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import Any, Final
 
 import httpx
+import orjson
 from celery import shared_task
 from celery.app.task import Task
 from celery.result import AsyncResult
@@ -19,22 +24,36 @@ DEFAULT_CONNECT_TIMEOUT_SECONDS: Final[float] = 3.0
 DEFAULT_READ_TIMEOUT_SECONDS: Final[float] = 8.0
 DEFAULT_WRITE_TIMEOUT_SECONDS: Final[float] = 8.0
 DEFAULT_POOL_TIMEOUT_SECONDS: Final[float] = 3.0
+MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+MAX_CONNECTIONS: Final[int] = 40
+BATCH_MAX_CONNECTIONS: Final[int] = 50
+BATCH_CONCURRENCY: Final[int] = 25
 MAX_RETRIES: Final[int] = 5
 BASE_RETRY_DELAY_SECONDS: Final[int] = 5
 MAX_RETRY_DELAY_SECONDS: Final[int] = 60
+JSON_HEADERS: Final[dict[str, str]] = {"Content-Type": "application/json"}
 
 
 class TelegramNotificationError(RuntimeError):
     """
     Исключение для ошибок отправки уведомлений в Telegram.
+
+    Attributes:
+        retry_after (int | None): Задержка в секундах, запрошенная Telegram в ответе 429.
     """
 
+    def __init__(self, message: str, *, retry_after: int | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class TelegramNotificationClient:
     """
     Клиент для отправки уведомлений через Telegram.
 
     Используется для взаимодействия с Telegram Bot API для отправки сообщений.
+    Держит постоянный HTTP/2-пул соединений, чтобы не устанавливать TLS-сессию
+    на каждое сообщение.
 
     Attributes:
         token (str): Токен бота, используемый для аутентификации.
@@ -65,8 +84,23 @@ class TelegramNotificationClient:
             write=DEFAULT_WRITE_TIMEOUT_SECONDS,
             pool=DEFAULT_POOL_TIMEOUT_SECONDS,
         )
-        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
-        self._token_fingerprint: Final[str] = token_hash[:12]
+        self._token_fingerprint: Final[str] = hashlib.blake2b(token.encode("utf-8"), digest_size=6).hexdigest()
+        self._http: Final[httpx.Client] = httpx.Client(
+            base_url=self._api_base_url,
+            timeout=self._timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS,
+            ),
+        )
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """
+        Закрывает пул HTTP-соединений клиента.
+        """
+        self._http.close()
 
     def send_message(
         self,
@@ -94,24 +128,132 @@ class TelegramNotificationClient:
             httpx.RequestError: Ошибка транспортного уровня при выполнении запроса.
             httpx.HTTPStatusError: Неожиданный HTTP-код статуса API Telegram.
         """
-        payload: dict[str, Any] = {"chat_id": chat_id, "text": text}
-        if parse_mode:
-            payload["parse_mode"] = parse_mode
-        if disable_web_page_preview is not None:
-            payload["disable_web_page_preview"] = disable_web_page_preview
+        payload = _build_payload(chat_id, text, parse_mode, disable_web_page_preview)
+        try:
+            response = self._http.post(self._endpoint, content=orjson.dumps(payload), headers=JSON_HEADERS)
+        except httpx.RequestError as exc:
+            self._log_transport_error(exc, chat_id)
+            raise
+        return self._process_response(response, chat_id)
+
+    def send_messages(self, messages: Sequence[tuple[int, str]]) -> list[dict[str, Any] | BaseException]:
+        """
+        Отправляет несколько сообщений конкурентно через асинхронный HTTP/2-клиент.
+
+        Args:
+            messages (Sequence[tuple[int, str]]): Пары (chat_id, text) для отправки.
 
-        endpoint = f"{self._api_base_url}/bot{self._token}/sendMessage"
+        Returns:
+            list[dict[str, Any] | BaseException]: Результаты в порядке входных сообщений:
+            ответ Telegram API либо исключение, возникшее при отправке.
+        """
+        if not messages:
+            return []
+        return asyncio.run(self._send_many(messages))
+
+    async def _send_many(self, messages: Sequence[tuple[int, str]]) -> list[dict[str, Any] | BaseException]:
+        """
+        Конкурентно отправляет сообщения в рамках одного асинхронного клиента.
+
+        Одновременно выполняется не больше `BATCH_CONCURRENCY` запросов, чтобы
+        большая порция не упиралась в лимиты Telegram и пул соединений.
+
+        Args:
+            messages (Sequence[tuple[int, str]]): Пары (chat_id, text) для отправки.
+
+        Returns:
+            list[dict[str, Any] | BaseException]: Результаты отправки каждого сообщения.
+        """
+        async with httpx.AsyncClient(
+            base_url=self._api_base_url,
+            timeout=self._timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=BATCH_MAX_CONNECTIONS),
+        ) as client:
+            semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+            async def send_bounded(chat_id: int, text: str) -> dict[str, Any]:
+                async with semaphore:
+                    return await self._send_one_async(client, chat_id, text)
+
+            return await asyncio.gather(
+                *(send_bounded(chat_id, text) for chat_id, text in messages),
+                return_exceptions=True,
+            )
+
+    async def _send_one_async(self, client: httpx.AsyncClient, chat_id: int, text: str) -> dict[str, Any]:
+        """
+        Асинхронно отправляет одно сообщение через переданный клиент.
+
+        Args:
+            client (httpx.AsyncClient): Асинхронный HTTP-клиент.
+            chat_id (int): Идентификатор чата.
+            text (str): Текст сообщения.
+
+        Returns:
+            dict[str, Any]: Ответ API Telegram в формате словаря.
+
+        Raises:
+            TelegramNotificationError: Ошибка при взаимодействии с Telegram API.
+            httpx.RequestError: Ошибка транспортного уровня при выполнении запроса.
+        """
+        payload = _build_payload(chat_id, text, None, None)
         try:
-            response = httpx.post(endpoint, json=payload, timeout=self._timeout)
-            response.raise_for_status()
-        except httpx.TimeoutException as exc:
+            response = await client.post(self._endpoint, content=orjson.dumps(payload), headers=JSON_HEADERS)
+        except httpx.RequestError as exc:
+            self._log_transport_error(exc, chat_id)
+            raise
+        return self._process_response(response, chat_id)
+
+    @property
+    def _endpoint(self) -> str:
+        """
+        Возвращает относительный путь метода sendMessage для текущего бота.
+
+        Returns:
+            str: Путь метода sendMessage.
+        """
+        return f"/bot{self._token}/sendMessage"
+
+    def _log_transport_error(self, exc: httpx.RequestError, chat_id: int) -> None:
+        """
+        Логирует ошибку транспортного уровня при обращении к Telegram.
+
+        Args:
+            exc (httpx.RequestError): Возникшее исключение.
+            chat_id (int): Идентификатор чата.
+        """
+        if isinstance(exc, httpx.TimeoutException):
             logger.warning(
                 "Timeout while sending Telegram message (bot_fingerprint=%s, chat_id=%s): %s",
                 self._token_fingerprint,
                 chat_id,
                 exc,
             )
-            raise
+            return
+        logger.warning(
+            "Transport error while contacting Telegram (bot_fingerprint=%s, chat_id=%s): %s",
+            self._token_fingerprint,
+            chat_id,
+            exc,
+        )
+
+    def _process_response(self, response: httpx.Response, chat_id: int) -> dict[str, Any]:
+        """
+        Проверяет HTTP-ответ Telegram и извлекает из него данные.
+
+        Args:
+            response (httpx.Response): Ответ Telegram API.
+            chat_id (int): Идентификатор чата.
+
+        Returns:
+            dict[str, Any]: Ответ API Telegram в формате словаря.
+
+        Raises:
+            TelegramNotificationError: Неожиданный HTTP-статус, некорректный JSON или `ok=false`.
+        """
+        try:
+            response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             logger.error(
                 "Unexpected HTTP status from Telegram (bot_fingerprint=%s, status=%s): %s",
@@ -120,19 +262,12 @@ class TelegramNotificationClient:
                 exc.response.text,
             )
             raise TelegramNotificationError(
-                f"Telegram API returned HTTP {exc.response.status_code} while sending a message."
+                f"Telegram API returned HTTP {exc.response.status_code} while sending a message.",
+                retry_after=_extract_retry_after(exc.response),
             ) from exc
-        except httpx.RequestError as exc:
-            logger.warning(
-                "Transport error while contacting Telegram (bot_fingerprint=%s, chat_id=%s): %s",
-                self._token_fingerprint,
-                chat_id,
-                exc,
-            )
-            raise
 
         try:
-            response_data: dict[str, Any] = response.json()
+            response_data: dict[str, Any] = orjson.loads(response.content)
         except ValueError as exc:
             logger.error(
                 "Telegram API returned invalid JSON (bot_fingerprint=%s, chat_id=%s)",
@@ -151,6 +286,51 @@ class TelegramNotificationClient:
         return response_data
 
 
+def _build_payload(
+    chat_id: int,
+    text: str,
+    parse_mode: str | None,
+    disable_web_page_preview: bool | None,
+) -> dict[str, Any]:
+    """
+    Формирует тело запроса sendMessage.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        text (str): Текст сообщения.
+        parse_mode (str | None): Режим форматирования текста.
+        disable_web_page_preview (bool | None): Флаг отключения предпросмотра ссылок.
+
+    Returns:
+        dict[str, Any]: Тело запроса для Telegram API.
+    """
+    payload: dict[str, Any] = {"chat_id": chat_id, "text": text}
+    if parse_mode:
+        payload["parse_mode"] = parse_mode
+    if disable_web_page_preview is not None:
+        payload["disable_web_page_preview"] = disable_web_page_preview
+    return payload
+
+
+def _extract_retry_after(response: httpx.Response) -> int | None:
+    """
+    Извлекает значение `parameters.retry_after` из ответа Telegram с кодом 429.
+
+    Args:
+        response (httpx.Response): Ответ Telegram API.
+
+    Returns:
+        int | None: Запрошенная задержка в секундах или None, если её нет.
+    """
+    if response.status_code != httpx.codes.TOO_MANY_REQUESTS:
+        return None
+    try:
+        retry_after = orjson.loads(response.content).get("parameters", {}).get("retry_after")
+    except (ValueError, AttributeError):
+        return None
+    return retry_after if isinstance(retry_after, int) and retry_after > 0 else None
+
+
 @lru_cache(maxsize=1)
 def get_notification_client() -> TelegramNotificationClient:
     """
@@ -182,6 +362,27 @@ def _compute_retry_delay(retry_index: int) -> int:
     return min(delay, MAX_RETRY_DELAY_SECONDS)
 
 
+def _retry_countdown(retry_index: int, retry_after: int | None = None) -> float:
+    """
+    Определяет задержку перед повторной попыткой.
+
+    Если Telegram сообщил `retry_after`, используется именно оно. Иначе задержка
+    выбирается случайно от нуля до экспоненциального предела (full jitter), чтобы
+    одновременно упавшие задачи не повторялись в один и тот же момент, в том
+    числе на первой попытке.
+
+    Args:
+        retry_index (int): Индекс текущей попытки повторной операции.
+        retry_after (int | None): Задержка, запрошенная Telegram.
+
+    Returns:
+        float: Задержка в секундах для следующей попытки.
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, _compute_retry_delay(retry_index))
+
+
 @shared_task(bind=True, max_retries=MAX_RETRIES, name="services.telegram.send_message")
 def send_telegram_message_task(
     self: Task,
@@ -228,7 +429,7 @@ def send_telegram_message_task(
         )
     except RETRYABLE_EXCEPTIONS as exc:
         retry_count = self.request.retries
-        countdown = _compute_retry_delay(retry_count)
+        countdown = _retry_countdown(retry_count, getattr(exc, "retry_after", None))
         logger.warning(
             "Retrying Telegram notification (attempt=%s/%s, chat_id=%s): %s",
             retry_count + 1,
@@ -239,6 +440,63 @@ def send_telegram_message_task(
         raise self.retry(exc=exc, countdown=countdown)
 
 
+@shared_task(bind=True, max_retries=MAX_RETRIES, name="services.telegram.send_messages_batch")
+def send_telegram_messages_batch_task(self: Task, *, messages: list[tuple[int, str]]) -> int:
+    """
+    Конкурентно отправляет пакет сообщений в Telegram.
+
+    Сообщения, не доставленные из-за временных ошибок, повторно ставятся в очередь
+    отдельной попыткой задачи с экспоненциальной задержкой.
+
+    Args:
+        self (Task): Задача Celery.
+        messages (list[tuple[int, str]]): Пары (chat_id, text) для отправки.
+
+    Returns:
+        int: Количество успешно отправленных сообщений.
+
+    Raises:
+        RuntimeError: Если конфигурация клиента Telegram некорректна.
+        self.retry: Если часть сообщений не доставлена из-за временных ошибок.
+    """
+    try:
+        client = get_notification_client()
+    except ValueError as exc:
+        logger.error("Telegram client configuration error: %s", exc)
+        raise RuntimeError("Telegram notifications are not configured.") from exc
+
+    results = client.send_messages([(chat_id, text) for chat_id, text in messages])
+
+    retryable: list[tuple[int, str]] = []
+    retry_after: int | None = None
+    sent_count = 0
+    for (chat_id, text), result in zip(messages, results):
+        if isinstance(result, RETRYABLE_EXCEPTIONS):
+            retryable.append((chat_id, text))
+            result_retry_after = getattr(result, "retry_after", None)
+            if result_retry_after is not None:
+                retry_after = max(retry_after or 0, result_retry_after)
+        elif isinstance(result, BaseException):
+            logger.error("Failed to send Telegram notification (chat_id=%s): %s", chat_id, result)
+        else:
+            sent_count += 1
+
+    if retryable:
+        retry_count = self.request.retries
+        logger.warning(
+            "Retrying %s Telegram notifications from batch (attempt=%s/%s)",
+            len(retryable),
+            retry_count + 1,
+            MAX_RETRIES,
+        )
+        raise self.retry(
+            kwargs={"messages": retryable},
+            exc=TelegramNotificationError(f"{len(retryable)} notifications failed with a retryable error."),
+            countdown=_retry_countdown(retry_count, retry_after),
+        )
+    return sent_count
+
+
 def send_task_due_message(telegram_chat_id: int, text: str) -> AsyncResult:
     """
     Отправляет сообщение о предстоящей задаче в указанный Telegram-чат.
@@ -280,10 +538,24 @@ def send_plaintext_notification(
     )
 
 
+def send_plaintext_notifications_batch(messages: Sequence[tuple[int, str]]) -> AsyncResult:
+    """
+    Ставит в очередь одну задачу на конкурентную отправку пакета текстовых уведомлений.
+
+    Args:
+        messages (Sequence[tuple[int, str]]): Пары (telegram_chat_id, text).
+
+    Returns:
+        AsyncResult: Объект асинхронного результата выполнения задачи.
+    """
+    return send_telegram_messages_batch_task.delay(messages=list(messages))
+
+
 __all__ = [
     "TelegramNotificationClient",
     "TelegramNotificationError",
     "get_notification_client",
     "send_plaintext_notification",
+    "send_plaintext_notifications_batch",
     "send_task_due_message",
 ]
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""Тесты генератора первичных ключей, кэша JWT-токенов бота и повторов уведомлений Telegram."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from types import MappingProxyType
+from unittest import mock
+
+from celery.exceptions import Retry
+from django.test import SimpleTestCase, override_settings
+
+from services import bot_auth, pk_keygen, telegram_notifications
+from services.telegram_notifications import TelegramNotificationError
+
+_FIXED_MS = 1_700_000_000_000
+
+
+def _b62_decode(encoded: str) -> int:
+    """
+    Декодирует строку base62 обратно в число.
+
+    Args:
+        encoded (str): Строка в формате base62.
+
+    Returns:
+        int: Исходное число.
+    """
+    num = 0
+    for ch in encoded:
+        num = num * pk_keygen._BASE + pk_keygen._BASE62_ALPHABET.index(ch)
+    return num
+
+
+class GeneratePkTests(SimpleTestCase):
+    """Проверяет формат `generate_pk`/`generate_pks`: `prefix + kind + b62((ms << 20) | seq)`."""
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(pk_keygen, "_now_ms", return_value=_FIXED_MS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.head = f"{pk_keygen._PREFIX}T"
+
+    def _packed(self, key: str) -> int:
+        """Проверяет префикс ключа и возвращает упакованное число `(ms << 20) | seq`."""
+        self.assertTrue(key.startswith(self.head))
+        return _b62_decode(key[len(self.head):])
+
+    def test_keys_within_one_millisecond_are_unique(self) -> None:
+        self.enterContext(mock.patch.object(pk_keygen, "_sequence", itertools.count()))
+        keys = [pk_keygen.generate_pk("T") for _ in range(1000)]
+        keys += pk_keygen.generate_pks("T", 10_000)
+
+        self.assertEqual(len(set(keys)), len(keys))
+        for key in keys:
+            self.assertEqual(self._packed(key) >> pk_keygen._SEQ_BITS, _FIXED_MS)
+
+    def test_sequence_wraps_at_two_to_the_twentieth(self) -> None:
+        last_seq = (1 << 20) - 1
+        with mock.patch.object(pk_keygen, "_sequence", itertools.count(last_seq)):
+            before, after = pk_keygen.generate_pks("T", 2)
+
+        self.assertEqual(self._packed(before), (_FIXED_MS << 20) | last_seq)
+        # Переполнение счётчика не должно залезать в биты метки времени.
+        self.assertEqual(self._packed(after), _FIXED_MS << 20)
+
+    def test_single_and_bulk_keys_share_prefix_and_kind(self) -> None:
+        keys = [pk_keygen.generate_pk("T"), *pk_keygen.generate_pks("T", 3)]
+
+        for key in keys:
+            self.assertEqual(key[: len(self.head)], self.head)
+        self.assertEqual(pk_keygen.generate_pks("T", 0), [])
+
+    def test_invalid_arguments(self) -> None:
+        for kind in ("", "TT", "-"):
+            with self.assertRaises(ValueError):
+                pk_keygen.generate_pk(kind)
+            with self.assertRaises(ValueError):
+                pk_keygen.generate_pks(kind, 1)
+        with self.assertRaises(ValueError):
+            pk_keygen.generate_pks("T", -1)
+
+
+class ClaimsCacheTests(SimpleTestCase):
+    """Проверяет кэш проверенных JWT-токенов бот-сервиса."""
+
+    def setUp(self) -> None:
+        bot_auth._claims_cache.clear()
+        self.addCleanup(bot_auth._claims_cache.clear)
+        self.key = bot_auth._token_cache_key("token")
+        self.now = time.time()
+
+    def _verified(self, exp: float) -> bot_auth._VerifiedToken:
+        """Собирает проверенный токен с заданным временем истечения."""
+        return bot_auth._VerifiedToken(MappingProxyType({"exp": exp, "tg_id": 1}), frozenset({"bot:act_as_user"}))
+
+    def test_hit_returns_read_only_claims(self) -> None:
+        verified = self._verified(self.now + 60)
+        bot_auth._store_cached_claims(self.key, verified, leeway=0)
+
+        cached = bot_auth._get_cached_claims(self.key)
+
+        self.assertIs(cached, verified)
+        with self.assertRaises(TypeError):
+            cached.claims["tg_id"] = 2
+
+    def test_entry_expires_at_exp_minus_leeway(self) -> None:
+        bot_auth._store_cached_claims(self.key, self._verified(self.now + 60), leeway=10)
+
+        with mock.patch.object(bot_auth.time, "time", return_value=self.now + 49):
+            self.assertIsNotNone(bot_auth._get_cached_claims(self.key))
+        with mock.patch.object(bot_auth.time, "time", return_value=self.now + 51):
+            self.assertIsNone(bot_auth._get_cached_claims(self.key))
+        self.assertNotIn(self.key, bot_auth._claims_cache)
+
+    def test_entry_lifetime_is_capped(self) -> None:
+        bot_auth._store_cached_claims(self.key, self._verified(self.now + 3600), leeway=0)
+
+        expires_at, _ = bot_auth._claims_cache[self.key]
+        self.assertLessEqual(expires_at, time.time() + bot_auth._CLAIMS_CACHE_MAX_TTL_SECONDS)
+
+    def test_expired_token_is_not_stored(self) -> None:
+        bot_auth._store_cached_claims(self.key, self._verified(self.now + 5), leeway=10)
+
+        self.assertIsNone(bot_auth._get_cached_claims(self.key))
+
+    def test_jwt_setting_change_clears_cache(self) -> None:
+        bot_auth._store_cached_claims(self.key, self._verified(self.now + 60), leeway=0)
+
+        with override_settings(BOT_JWT_AUD="other-backend"):
+            self.assertIsNone(bot_auth._get_cached_claims(self.key))
+            self.assertEqual(bot_auth._jwt_settings().audience, "other-backend")
+
+
+class RetryCountdownTests(SimpleTestCase):
+    """Проверяет задержку повторной отправки уведомлений Telegram."""
+
+    def setUp(self) -> None:
+        self.client = mock.Mock()
+        self.enterContext(
+            mock.patch.object(telegram_notifications, "get_notification_client", return_value=self.client)
+        )
+
+    def test_first_retry_is_jittered(self) -> None:
+        countdowns = {telegram_notifications._retry_countdown(0) for _ in range(50)}
+
+        self.assertGreater(len(countdowns), 1)
+        for countdown in countdowns:
+            self.assertGreaterEqual(countdown, 0)
+            self.assertLessEqual(countdown, telegram_notifications.BASE_RETRY_DELAY_SECONDS)
+
+    def test_single_message_task_honours_retry_after(self) -> None:
+        task = telegram_notifications.send_telegram_message_task
+        self.client.send_message.side_effect = TelegramNotificationError("Too Many Requests", retry_after=17)
+
+        with mock.patch.object(task, "retry", return_value=Retry()) as retry:
+            with self.assertRaises(Retry):
+                task.run(chat_id=1, text="hi")
+
+        self.assertEqual(retry.call_args.kwargs["countdown"], 17)
+
+    def test_batch_task_honours_largest_retry_after(self) -> None:
+        task = telegram_notifications.send_telegram_messages_batch_task
+        self.client.send_messages.return_value = [
+            TelegramNotificationError("Too Many Requests", retry_after=7),
+            {"ok": True},
+            TelegramNotificationError("Too Many Requests", retry_after=3),
+        ]
+
+        with mock.patch.object(task, "retry", return_value=Retry()) as retry:
+            with self.assertRaises(Retry):
+                task.run(messages=[(1, "a"), (2, "b"), (3, "c")])
+
+        self.assertEqual(retry.call_args.kwargs["countdown"], 7)
+        self.assertEqual(retry.call_args.kwargs["kwargs"], {"messages": [(1, "a"), (3, "c")]})
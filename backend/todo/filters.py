@@ -39,9 +39,4 @@ def tasks_for_user(user: User) -> QuerySet[Task]:
     Returns:
         QuerySet[Task]: Отфильтрованный и упорядоченный список задач пользователя.
     """
-    return (
-        Task.objects.select_related("user")
-        .prefetch_related("categories")
-        .filter(user=user)
-        .order_by("-created_at")
-    )
+    return Task.objects.select_related("user").filter(user=user).order_by("-created_at")
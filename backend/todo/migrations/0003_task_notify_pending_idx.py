@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-14 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0002_task_due_notified_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('due_notified_at__isnull', True), ('status', 'active')), fields=['due_at'], name='task_notify_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-14 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todo', '0003_task_notify_pending_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('owner__isnull', True)), fields=['slug'], name='cat_global_slug_idx'),
+        ),
+    ]
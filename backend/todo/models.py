@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 
 from services.pk_keygen import generate_pk
 from services.slugify import slugify_unicode
@@ -24,6 +25,7 @@ class Category(models.Model):
     Метаданные:
         - Уникальное ограничение для комбинации поля `owner` и `slug`.
         - Индексация полей `owner` и `slug`.
+        - Частичный индекс по `slug` для глобальных категорий.
     """
     id = models.CharField(primary_key=True, max_length=26, editable=False)
     owner = models.ForeignKey(
@@ -42,6 +44,8 @@ class Category(models.Model):
         ]
         indexes = [
             models.Index(fields=["owner", "slug"]),
+            # Глобальные категории (owner IS NULL) ищутся по slug в ensure_preset_categories.
+            models.Index(fields=["slug"], condition=Q(owner__isnull=True), name="cat_global_slug_idx"),
         ]
 
     def save(self, *args, **kwargs):
@@ -110,6 +114,12 @@ class Task(models.Model):
         indexes = [
             models.Index(fields=["user", "status"]),
             models.Index(fields=["due_at"]),
+            # Частичный индекс под выборку notify_upcoming_tasks: только задачи, ждущие уведомления.
+            models.Index(
+                fields=["due_at"],
+                condition=Q(status="active", due_notified_at__isnull=True),
+                name="task_notify_pending_idx",
+            ),
         ]
 
     def save(self, *args, **kwargs):
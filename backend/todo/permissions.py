@@ -27,10 +27,13 @@ class IsOwnerOrReadOnly(BasePermission):
         """
         if request.method in SAFE_METHODS:
             return True
-        owner = getattr(obj, "owner", None)
-        if owner is None:
+        if not request.user.is_authenticated:
             return False
-        return owner == request.user
+        # Сравниваем внешние ключи, чтобы не загружать владельца отдельным запросом.
+        owner_id = getattr(obj, "owner_id", None)
+        if owner_id is None:
+            return False
+        return owner_id == request.user.pk
 
 
 class IsTaskOwner(BasePermission):
@@ -51,4 +54,5 @@ class IsTaskOwner(BasePermission):
             bool: Возвращает True, если пользователь объекта совпадает с пользователем,
             отправившим запрос, иначе False.
         """
-        return getattr(obj, "user", None) == request.user
+        user_id = getattr(obj, "user_id", None)
+        return user_id is not None and user_id == request.user.pk
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable, Sequence
 
-from django.db.models import Q
+from django.db.models import Prefetch, Q, QuerySet
 from rest_framework import serializers
 
 from todo.models import Category, Task, TaskStatus
@@ -109,6 +109,21 @@ class TaskSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "created_at")
 
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet[Task]) -> QuerySet[Task]:
+        """
+        Подгружает связанные категории одним запросом для всего набора задач.
+
+        Args:
+            queryset (QuerySet[Task]): Исходный набор задач.
+
+        Returns:
+            QuerySet[Task]: Набор задач с предзагруженными категориями.
+        """
+        return queryset.prefetch_related(
+            Prefetch("categories", queryset=Category.objects.only("id", "name", "slug"))
+        )
+
     def get_categories_detail(self, obj: Task):
         """
         Возвращает подробности категорий объекта Task.
@@ -120,38 +135,42 @@ class TaskSerializer(serializers.ModelSerializer):
             list: Список словарей с информацией о категориях. Каждый словарь содержит
             "id", "name" и "slug" категории.
         """
+        # Только .all(): любые .filter()/.values() обходят кэш prefetch_related.
         cats = obj.categories.all()
         return [{"id": c.id, "name": c.name, "slug": c.slug} for c in cats]
 
     def _resolve_categories(
             self, ids: Iterable[str], *, user
-    ) -> Sequence[Category]:
+    ) -> Sequence[str]:
         """
         Разрешает категории по идентификаторам с учетом пользователя.
 
+        Из базы читаются только идентификаторы: менеджер M2M принимает их в `.set()`
+        напрямую, поэтому объекты Category не создаются.
+
         Args:
             ids (Iterable[str]): Список строковых идентификаторов категорий.
             user: Пользователь, для которого фильтруются категории.
 
         Returns:
-            Sequence[Category]: Список найденных категорий.
+            Sequence[str]: Идентификаторы найденных категорий.
 
         Raises:
             serializers.ValidationError: Вызывается, если одна или несколько категорий
                 не найдены или недоступны для пользователя.
         """
-        ids = list(dict.fromkeys(ids))  # де-дуп
+        ids = set(ids)  # де-дуп; порядок для IN не важен
         if not ids:
             return []
         # доступны: глобальные (owner is null) + свои
         qs = Category.objects.filter(Q(owner__isnull=True) | Q(owner=user), id__in=ids)
-        found = list(qs)
-        if len(found) != len(ids):
-            missing = set(ids) - {c.id for c in found}
+        found_ids = set(qs.values_list("id", flat=True))
+        if len(found_ids) != len(ids):
+            missing = ids - found_ids
             raise serializers.ValidationError(
                 {"categories": [f"Unknown or forbidden category id: {m}" for m in sorted(missing)]}
             )
-        return found
+        return list(found_ids)
 
     def validate_status(self, value: str) -> str:
         """
@@ -182,10 +201,10 @@ class TaskSerializer(serializers.ModelSerializer):
         """
         user = self.context["request"].user
         ids = validated_data.pop("categories", [])
-        categories = self._resolve_categories(ids, user=user)
+        category_ids = self._resolve_categories(ids, user=user)
         task = Task.objects.create(user=user, **validated_data)
-        if categories:
-            task.categories.set(categories)
+        if category_ids:
+            task.categories.set(category_ids)
         return task
 
     def update(self, instance: Task, validated_data):
@@ -203,6 +222,10 @@ class TaskSerializer(serializers.ModelSerializer):
         ids = validated_data.pop("categories", None)
         instance = super().update(instance, validated_data)
         if ids is not None:
-            cats = self._resolve_categories(ids, user=user)
-            instance.categories.set(cats)
+            category_ids = set(self._resolve_categories(ids, user=user))
+            # Задача из TaskViewSet приходит с предзагруженными категориями, поэтому
+            # сравнение не требует запроса; при совпадении set() можно не вызывать.
+            current_ids = {category.pk for category in instance.categories.all()}
+            if category_ids != current_ids:
+                instance.categories.set(category_ids)
         return instance
@@ -26,19 +26,36 @@ def ensure_preset_categories(sender, **kwargs) -> None:
     if getattr(sender, "name", None) != "todo":
         return
 
-    from services.pk_keygen import generate_pk
+    from services.pk_keygen import generate_pks
     from todo.models import Category, slugify_unicode
 
+    presets: dict[str, str] = {}
     for raw_name in PRESET_CATEGORIES:
         name = (raw_name or "").strip()
-        if not name:
-            continue
-        slug = slugify_unicode(name)
-        obj, created = Category.objects.get_or_create(
-            owner=None,
-            slug=slug,
-            defaults={"id": generate_pk("C"), "name": name},
+        if name:
+            presets.setdefault(slugify_unicode(name), name)
+    if not presets:
+        return
+
+    # owner IS NULL не участвует в уникальном ограничении (NULL не равны друг другу),
+    # поэтому bulk_create(ignore_conflicts=True) не защитил бы от дублей:
+    # сначала читаем существующие глобальные категории одним запросом.
+    existing = {
+        category.slug: category
+        for category in Category.objects.filter(owner__isnull=True, slug__in=presets).only("id", "name", "slug")
+    }
+
+    missing = [slug for slug in presets if slug not in existing]
+    if missing:
+        Category.objects.bulk_create(
+            Category(id=pk, owner=None, slug=slug, name=presets[slug])
+            for pk, slug in zip(generate_pks("C", len(missing)), missing)
         )
-        if not created and obj.name != name:
-            obj.name = name
-            obj.save(update_fields=["name"])
+
+    to_rename = []
+    for slug, category in existing.items():
+        if category.name != presets[slug]:
+            category.name = presets[slug]
+            to_rename.append(category)
+    if to_rename:
+        Category.objects.bulk_update(to_rename, ["name"])
@@ -3,79 +3,110 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Final
 
 from celery import shared_task
 from django.db import transaction
 from django.utils import timezone
-from django.utils.formats import date_format
+from django.utils import dateformat
+from django.utils.formats import get_format
 from django.utils.timezone import localtime
 
-from services.telegram_notifications import send_plaintext_notification
+from services.telegram_notifications import send_plaintext_notifications_batch
 from todo.models import Task, TaskStatus
 
 
 LOGGER = logging.getLogger(__name__)
 NOTIFICATION_LOOKAHEAD_HOURS: Final[int] = 24
+NOTIFICATION_CHUNK_SIZE: Final[int] = 500
 
 
-@shared_task(name="todo.notify_upcoming_tasks")
-def notify_upcoming_tasks() -> None:
+def _claim_due_chunk(now: datetime, window_end: datetime) -> tuple[list[tuple[int, str]], list[str]]:
     """
-    Отправляет уведомления о приближающихся задачах пользователям через Telegram.
+    Отбирает очередную порцию задач для уведомления и помечает их отправленными.
+
+    Блокировки строк удерживаются только внутри этой короткой транзакции.
 
     Args:
-        None
+        now (datetime): Начало окна уведомлений.
+        window_end (datetime): Конец окна уведомлений.
 
     Returns:
-        None
-
-    Raises:
-        Exception: Если произошла ошибка при отправке уведомления Telegram.
+        tuple[list[tuple[int, str]], list[str]]: Пары (chat_id, text) и идентификаторы
+        помеченных задач.
     """
-    now = timezone.now()
-    notification_window_end = now + timedelta(hours=NOTIFICATION_LOOKAHEAD_HOURS)
+    messages: list[tuple[int, str]] = []
+    claimed_ids: list[str] = []
 
     with transaction.atomic():
         tasks_to_notify = list(
-            Task.objects.select_for_update(skip_locked=True)
+            Task.objects.select_for_update(skip_locked=True, of=("self",))
             .select_related("user")
+            .only("id", "title", "due_at", "user__id", "user__telegram_user_id")
             .filter(
                 status=TaskStatus.ACTIVE,
                 due_at__isnull=False,
                 due_notified_at__isnull=True,
                 due_at__gt=now,
-                due_at__lte=notification_window_end,
+                due_at__lte=window_end,
                 user__telegram_user_id__isnull=False,
             )
+            .order_by("due_at")[:NOTIFICATION_CHUNK_SIZE]
         )
 
-        processed_count = 0
-
+        # Формат разрешается один раз на порцию; сам Django-формат не совместим со strftime,
+        # поэтому значение форматируется через dateformat.format.
+        datetime_format = get_format("DATETIME_FORMAT", use_l10n=True)
         for task in tasks_to_notify:
             telegram_chat_id = task.user.telegram_user_id
             if telegram_chat_id is None:
                 LOGGER.warning("Task %s has no Telegram chat ID despite filtering", task.pk)
                 continue
 
-            localized_due_at = localtime(task.due_at)
-            due_at_display = date_format(localized_due_at, "DATETIME_FORMAT", use_l10n=True)
-            message = f"{task.title}\n{due_at_display}"
-
-            try:
-                send_plaintext_notification(telegram_chat_id=telegram_chat_id, text=message)
-            except Exception as exc:
-                LOGGER.exception(
-                    "Failed to send due notification for task %s: %s",
-                    task.pk,
-                    exc,
-                )
-                continue
+            due_at_display = dateformat.format(localtime(task.due_at), datetime_format)
+            messages.append((telegram_chat_id, f"{task.title}\n{due_at_display}"))
+            claimed_ids.append(task.pk)
+
+        if claimed_ids:
+            Task.objects.filter(pk__in=claimed_ids).update(due_notified_at=timezone.now())
+
+    return messages, claimed_ids
+
+
+@shared_task(name="todo.notify_upcoming_tasks")
+def notify_upcoming_tasks() -> None:
+    """
+    Отправляет уведомления о приближающихся задачах пользователям через Telegram.
+
+    Задачи обрабатываются порциями по `NOTIFICATION_CHUNK_SIZE`, поэтому в памяти
+    и под блокировкой одновременно находится не больше одной порции.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    Raises:
+        Exception: Если произошла ошибка при отправке уведомления Telegram.
+    """
+    now = timezone.now()
+    notification_window_end = now + timedelta(hours=NOTIFICATION_LOOKAHEAD_HOURS)
 
-            task.due_notified_at = timezone.now()
-            task.save(update_fields=["due_notified_at"])
-            processed_count += 1
+    processed_count = 0
+    while True:
+        messages, claimed_ids = _claim_due_chunk(now, notification_window_end)
+        if not claimed_ids:
+            break
+        try:
+            send_plaintext_notifications_batch(messages)
+        except Exception as exc:
+            LOGGER.exception("Failed to enqueue %s due notifications: %s", len(messages), exc)
+            # Снимаем отметку, чтобы задачи попали в следующий запуск.
+            Task.objects.filter(pk__in=claimed_ids).update(due_notified_at=None)
+            break
+        processed_count += len(claimed_ids)
 
     LOGGER.info("Processed %s upcoming task notifications", processed_count)
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Final
+
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
@@ -11,6 +13,8 @@ from todo.models import Category, Task
 from todo.permissions import IsOwnerOrReadOnly, IsTaskOwner
 from todo.serializers import CategorySerializer, TaskSerializer
 
+_HEALTH_PAYLOAD: Final[dict[str, str]] = {"status": "ok", "tz": "America/Adak"}
+
 
 @api_view(["GET"])
 def health(_request):
@@ -23,7 +27,7 @@ def health(_request):
     Returns:
         Response: Ответ с состоянием сервиса и временной зоной.
     """
-    return Response({"status": "ok", "tz": "America/Adak"})
+    return Response(_HEALTH_PAYLOAD)
 
 
 class CategoryViewSet(viewsets.ModelViewSet):
@@ -94,7 +98,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         Returns:
             QuerySet: Набор задач, относящихся к текущему пользователю.
         """
-        return tasks_for_user(self.request.user)
+        return self.get_serializer_class().setup_eager_loading(tasks_for_user(self.request.user))
 
     def perform_create(self, serializer: TaskSerializer):
         """
@@ -81,21 +81,21 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault("is_superuser", True)
         return self._create_user(username, password, **extra_fields)
 
-    def create_from_telegram(self, tg_user_id: int) -> "User":
+    def create_from_telegram(self, tg_user_id: int, username: str | None = None) -> tuple["User", bool]:
         """
         Создает или извлекает существующего пользователя на основе Telegram ID.
 
         Args:
             tg_user_id (int): Идентификатор пользователя в Telegram.
+            username (str | None): Имя пользователя, сохраняемое только при создании.
 
         Returns:
-            User: Пользователь, созданный или извлеченный из базы данных.
+            tuple[User, bool]: Пользователь и флаг, был ли он создан.
         """
-        user, created = self.get_or_create(
+        return self.get_or_create(
             telegram_user_id=tg_user_id,
-            defaults={"id": generate_pk("U"), "username": None},
+            defaults={"id": generate_pk("U"), "username": username or None},
         )
-        return user
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -49,14 +49,7 @@ class BotRegisterView(APIView):
         tg_id = data.validated_data["tg_id"]
         username = data.validated_data.get("username")
 
-        user = User.objects.filter(telegram_user_id=tg_id).first()
-        is_new = False
-        if not user:
-            user = User.objects.create_from_telegram(tg_user_id=tg_id)
-            if username and not user.username:
-                user.username = username
-                user.save(update_fields=["username"])
-            is_new = True
+        user, is_new = User.objects.create_from_telegram(tg_user_id=tg_id, username=username)
 
         return Response(
             {"user_id": user.id, "tg_id": user.telegram_user_id, "is_new": is_new},
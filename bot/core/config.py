@@ -23,6 +23,8 @@ class Settings(BaseSettings):
         bot_jwt_ttl (int): Время жизни JWT в секундах. Значение по умолчанию: 120.
         http_timeout (float): Таймаут HTTP-запросов в секундах. Значение по умолчанию: 10.0.
         http_retries (int): Количество попыток повторить HTTP-запрос. Значение по умолчанию: 3.
+        http2 (bool): Разрешить HTTP/2 к бэкенду. Согласуется только по HTTPS (ALPN).
+            Значение по умолчанию: False.
         user_tz (str): Часовой пояс пользователя. Значение по умолчанию: "America/Adak".
         health_port (int): Порт для сервера проверки состояния приложения. Значение по умолчанию: 8000.
     """
@@ -42,6 +44,7 @@ class Settings(BaseSettings):
     # HTTP
     http_timeout: float = Field(10.0, alias="HTTP_TIMEOUT")
     http_retries: int = Field(3, alias="HTTP_RETRIES")
+    http2: bool = Field(False, alias="HTTP2")
 
     # UI
     user_tz: str = Field("America/Adak", alias="USER_TZ")
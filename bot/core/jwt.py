@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import Any, Final
 
 import jwt
 
 from core.config import settings
 
+# За сколько секунд до истечения токен подписывается заново.
+REFRESH_MARGIN_SECONDS: Final[int] = 30
+
+# Готовый заголовок Authorization и момент (time.time()), после которого его нужно обновить.
+_cached_auth_header: tuple[str, float] | None = None
+
 
 def build_bot_jwt(extra_claims: dict[str, Any] | None = None) -> str:
     """
@@ -36,3 +42,21 @@ def build_bot_jwt(extra_claims: dict[str, Any] | None = None) -> str:
         claims.update(extra_claims)
     token = jwt.encode(claims, settings.bot_jwt_private_key, algorithm="RS256")
     return token
+
+
+def get_bot_auth_header() -> str:
+    """
+    Возвращает заголовок Authorization с токеном бота, переиспользуя ещё действующий.
+
+    Подпись RS256 заметно дороже HTTP-запроса к локальному бэкенду, поэтому токен
+    подписывается заново только ближе к концу срока жизни.
+
+    Returns:
+        str: Значение заголовка в виде "Bearer <token>".
+    """
+    global _cached_auth_header
+    now = time.time()
+    if _cached_auth_header is None or now >= _cached_auth_header[1]:
+        margin = min(REFRESH_MARGIN_SECONDS, settings.bot_jwt_ttl // 2)
+        _cached_auth_header = (f"Bearer {build_bot_jwt()}", now + settings.bot_jwt_ttl - margin)
+    return _cached_auth_header[0]
@@ -0,0 +1,23 @@
+"""Диалоги бота в порядке их подключения к диспетчеру."""
+
+from __future__ import annotations
+
+from aiogram_dialog import Dialog
+
+from dialogs.add_category import add_category_dialog
+from dialogs.category_delete import delete_category_dialog
+from dialogs.category_edit import edit_category_dialog
+from dialogs.task_add import add_task_dialog
+from dialogs.task_delete import delete_task_dialog
+from dialogs.task_edit import edit_task_dialog
+from dialogs.task_status import change_task_status_dialog
+
+DIALOGS: tuple[Dialog, ...] = (
+    add_task_dialog,
+    edit_task_dialog,
+    delete_task_dialog,
+    change_task_status_dialog,
+    add_category_dialog,
+    edit_category_dialog,
+    delete_category_dialog,
+)
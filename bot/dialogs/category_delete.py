@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery
 from aiogram_dialog import Dialog, DialogManager, Window
-from aiogram_dialog.widgets.kbd import Back, Button, Cancel, ScrollingGroup, Select
+from aiogram_dialog.widgets.kbd import Button, ScrollingGroup, Select
 from aiogram_dialog.widgets.text import Const, Format
+from dialogs.common import BACK, CANCEL, ITEM_ID, ITEM_LABEL
 from services.api import BackendAPI, BackendError
+from utils.dialog_cache import SelectItem, build_category_choices
 
 
 class DeleteCategorySG(StatesGroup):
@@ -19,11 +22,12 @@ class DeleteCategorySG(StatesGroup):
     confirm = State()
 
 
-async def categories_getter(dialog_manager: DialogManager, **_: Any) -> dict[str, Any]:
+async def categories_getter(dialog_manager: DialogManager, api: BackendAPI, **_: Any) -> dict[str, Any]:
     """Получает список категорий и преобразует их для использования в диалогах.
 
     Args:
         dialog_manager (DialogManager): Менеджер диалога.
+        api (BackendAPI): Общий клиент бэкенда.
         **_ (Any): Другие параметры.
 
     Returns:
@@ -31,22 +35,9 @@ async def categories_getter(dialog_manager: DialogManager, **_: Any) -> dict[str
         "categories" содержит список категорий для отображения. "has_categories" — True,
         если категории существуют, иначе False. "no_categories" — True, если категории отсутствуют.
     """
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        categories = await api.list_categories(tg_id=tg_id)
-    finally:
-        await api.aclose()
-
-    items: list[dict[str, str]] = []
-    for category in categories:
-        identifier = category.get("id") or category.get("slug")
-        name = category.get("name", "Без названия")
-        if identifier is None:
-            continue
-        items.append({"id": str(identifier), "label": name})
-
-    dialog_manager.dialog_data["categories_raw"] = categories
+    choices = build_category_choices(await api.list_categories(tg_id=dialog_manager.event.from_user.id))
+    items: list[SelectItem] = choices["items"]
+    dialog_manager.dialog_data["categories_index"] = choices["index"]
     has_categories = bool(items)
     return {
         "categories": items,
@@ -73,16 +64,8 @@ async def on_category_selected(
     Raises:
         None: Если категория не найдена.
     """
-    categories: list[dict[str, Any]] = manager.dialog_data.get("categories_raw", [])
-    selected = next(
-        (
-            category
-            for category in categories
-            if str(category.get("id")) == item_id
-               or str(category.get("slug")) == item_id
-        ),
-        None,
-    )
+    index: dict[str, dict[str, Any]] = manager.dialog_data.get("categories_index", {})
+    selected = index.get(item_id)
     if selected is None:
         await callback.answer("Категория не найдена", show_alert=True)
         return
@@ -119,13 +102,13 @@ async def confirm_delete(
         await callback.answer("Не выбрана категория", show_alert=True)
         return
 
-    api = BackendAPI()
+    api: BackendAPI = manager.middleware_data["api"]
     tg_id = callback.from_user.id
     try:
         await api.delete_category(tg_id=tg_id, category_id=str(category_id))
     except BackendError as exc:
         message = str(exc)
-        if message.startswith("404"):
+        if exc.status == 404:
             user_message = "Категория уже удалена или недоступна."
         else:
             user_message = f"Ошибка удаления: {message}"
@@ -136,13 +119,13 @@ async def confirm_delete(
         await callback.answer("Не удалось удалить", show_alert=True)
         await callback.message.answer(f"Непредвиденная ошибка: {exc}")
         return
-    finally:
-        await api.aclose()
 
-    await callback.message.answer(
-        "Категория удалена. Связанные задачи останутся без категории и будут отображаться как 'без категории'."
+    await asyncio.gather(
+        callback.message.answer(
+            "Категория удалена. Связанные задачи останутся без категории и будут отображаться как 'без категории'."
+        ),
+        manager.done(),
     )
-    await manager.done()
 
 
 delete_category_dialog = Dialog(
@@ -150,9 +133,9 @@ delete_category_dialog = Dialog(
         Const("Выбери категорию для удаления:"),
         ScrollingGroup(
             Select(
-                Format("{item[label]}"),
+                ITEM_LABEL,
                 id="delete_category_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="categories",
                 on_click=on_category_selected,
             ),
@@ -162,7 +145,7 @@ delete_category_dialog = Dialog(
             when="has_categories",
         ),
         Const("Категорий пока нет. Создай новую через /addcat.", when="no_categories"),
-        Cancel(Const("Отмена")),
+        CANCEL,
         state=DeleteCategorySG.choose_category,
         getter=categories_getter,
     ),
@@ -172,8 +155,8 @@ delete_category_dialog = Dialog(
         Button(
             Const("Удалить"), id="confirm_delete_category_btn", on_click=confirm_delete
         ),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=DeleteCategorySG.confirm,
     ),
 )
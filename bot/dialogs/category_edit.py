@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, DialogManager, Window
 from aiogram_dialog.widgets.input import TextInput
-from aiogram_dialog.widgets.kbd import Back, Button, Cancel, ScrollingGroup, Select
+from aiogram_dialog.widgets.kbd import Button, ScrollingGroup, Select
 from aiogram_dialog.widgets.text import Const, Format
 
+from dialogs.common import BACK, CANCEL, ITEM_ID, ITEM_LABEL, MAX_CATEGORY_NAME_LENGTH
 from services.api import BackendAPI
+from utils.dialog_cache import SelectItem, build_category_choices
 
 
 class EditCategorySG(StatesGroup):
@@ -22,38 +25,21 @@ class EditCategorySG(StatesGroup):
     confirm = State()
 
 
-async def categories_getter(dialog_manager: DialogManager, **_: Any) -> dict[str, Any]:
+async def categories_getter(dialog_manager: DialogManager, api: BackendAPI, **_: Any) -> dict[str, Any]:
     """Загружает список категорий пользователя для отображения в диалоге.
 
     Args:
         dialog_manager (DialogManager): Менеджер диалога, управляющий контекстом.
+        api (BackendAPI): Общий клиент бэкенда.
         **_ (Any): Дополнительные аргументы, которые игнорируются.
 
     Returns:
         dict[str, Any]: Данные для шаблонов диалога.
     """
 
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        categories = await api.list_categories(tg_id=tg_id)
-    finally:
-        await api.aclose()
-
-    items: list[dict[str, str]] = []
-    for category in categories:
-        identifier = category.get("id") or category.get("slug")
-        name = category.get("name", "Без названия")
-        if identifier is None:
-            continue
-        items.append(
-            {
-                "id": str(identifier),
-                "label": f"{name}",
-            }
-        )
-
-    dialog_manager.dialog_data["categories_raw"] = categories
+    choices = build_category_choices(await api.list_categories(tg_id=dialog_manager.event.from_user.id))
+    items: list[SelectItem] = choices["items"]
+    dialog_manager.dialog_data["categories_index"] = choices["index"]
     has_categories = bool(items)
     return {
         "categories": items,
@@ -77,25 +63,18 @@ async def on_category_selected(
         item_id (str): Идентификатор выбранной категории.
     """
 
-    categories: list[dict[str, Any]] = manager.dialog_data.get("categories_raw", [])
-    selected = next(
-        (
-            category
-            for category in categories
-            if str(category.get("id")) == item_id
-            or str(category.get("slug")) == item_id
-        ),
-        None,
-    )
+    index: dict[str, dict[str, Any]] = manager.dialog_data.get("categories_index", {})
+    selected = index.get(item_id)
     if selected is None:
         await callback.answer("Категория не найдена", show_alert=True)
         return
 
+    name = selected.get("name", "").strip()
     manager.dialog_data.update(
         {
             "category_id": str(selected.get("id") or selected.get("slug") or item_id),
-            "original_name": selected.get("name", ""),
-            "new_name": selected.get("name", ""),
+            "original_name": name,
+            "new_name": name,
         }
     )
     await manager.switch_to(EditCategorySG.new_name)
@@ -120,8 +99,11 @@ async def on_name_input(
     if not new_name:
         await message.answer("Название не может быть пустым.")
         return
-    if len(new_name) > 50:
-        await message.answer("Название должно быть короче 50 символов.")
+    if len(new_name) > MAX_CATEGORY_NAME_LENGTH:
+        await message.answer(f"Название должно быть короче {MAX_CATEGORY_NAME_LENGTH} символов.")
+        return
+    if new_name == manager.dialog_data.get("original_name"):
+        await message.answer("Название не изменилось.")
         return
 
     manager.dialog_data["new_name"] = new_name
@@ -142,8 +124,8 @@ async def save_category(
     """
 
     category_id = manager.dialog_data.get("category_id")
-    new_name: str = manager.dialog_data.get("new_name", "").strip()
-    original_name: str = manager.dialog_data.get("original_name", "").strip()
+    new_name: str = manager.dialog_data.get("new_name", "")
+    original_name: str = manager.dialog_data.get("original_name", "")
     if not category_id:
         await callback.answer("Не удалось определить категорию", show_alert=True)
         return
@@ -154,23 +136,23 @@ async def save_category(
         await callback.answer("Название не изменилось", show_alert=True)
         return
 
-    api = BackendAPI()
+    api: BackendAPI = manager.middleware_data["api"]
     tg_id = callback.from_user.id
     try:
         updated = await api.patch_category(
             tg_id=tg_id, category_id=str(category_id), name=new_name
         )
-        await callback.message.answer(
-            "Категория обновлена:\n"
-            f"• Было: {original_name or '—'}\n"
-            f"• Стало: {updated.get('name', new_name)}"
+        await asyncio.gather(
+            callback.message.answer(
+                "Категория обновлена:\n"
+                f"• Было: {original_name or '—'}\n"
+                f"• Стало: {updated.get('name', new_name)}"
+            ),
+            manager.done(),
         )
-        await manager.done()
     except Exception as exc:  # noqa: BLE001 - транслируем пользователю текст ошибки
         await callback.answer("Не удалось обновить", show_alert=True)
         await callback.message.answer(f"Ошибка переименования: {exc}")
-    finally:
-        await api.aclose()
 
 
 edit_category_dialog = Dialog(
@@ -178,9 +160,9 @@ edit_category_dialog = Dialog(
         Const("Выбери категорию для переименования:"),
         ScrollingGroup(
             Select(
-                Format("{item[label]}"),
+                ITEM_LABEL,
                 id="category_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="categories",
                 on_click=on_category_selected,
             ),
@@ -190,7 +172,7 @@ edit_category_dialog = Dialog(
             when="has_categories",
         ),
         Const("Категорий пока нет. Создай новую через /addcat.", when="no_categories"),
-        Cancel(Const("Отмена")),
+        CANCEL,
         state=EditCategorySG.choose_category,
         getter=categories_getter,
     ),
@@ -198,8 +180,8 @@ edit_category_dialog = Dialog(
         Format("Текущее название: {dialog_data[original_name]}"),
         Const("Введи новое название категории."),
         TextInput(id="category_name_input", on_success=on_name_input),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditCategorySG.new_name,
     ),
     Window(
@@ -207,8 +189,8 @@ edit_category_dialog = Dialog(
         Format("Было: {dialog_data[original_name]}"),
         Format("Станет: {dialog_data[new_name]}"),
         Button(Const("Сохранить"), id="save_category_btn", on_click=save_category),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditCategorySG.confirm,
     ),
 )
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""Общие виджеты, которые повторяются во всех диалогах."""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Final
+
+from aiogram.types import CallbackQuery
+from aiogram_dialog import DialogManager
+from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Row
+from aiogram_dialog.widgets.text import Const, Format
+
+from services.api import BackendAPI
+from utils.dialog_cache import (
+    SelectItem,
+    change_tasks_page,
+    format_task_label,
+    format_task_line,
+    get_tasks_cached,
+    tasks_pager_data,
+)
+
+# Ограничение длины названия категории при создании и переименовании.
+MAX_CATEGORY_NAME_LENGTH: Final[int] = 50
+
+# Виджеты не хранят состояния, поэтому один экземпляр можно ставить в любое окно.
+CANCEL = Cancel(Const("Отмена"))
+BACK = Back(Const("Назад"))
+# Подпись и id элемента `SelectItem`; шаблон разбирается один раз при импорте.
+ITEM_LABEL = Format("{item.label}")
+ITEM_ID = attrgetter("id")
+
+
+async def _on_tasks_prev(_: CallbackQuery, __: Button, manager: DialogManager) -> None:
+    """
+    Переходит на предыдущую страницу задач.
+
+    Args:
+        _ (CallbackQuery): Колбэк от кнопки.
+        __ (Button): Кнопка листания.
+        manager (DialogManager): Менеджер диалога.
+    """
+    change_tasks_page(manager, -1)
+
+
+async def _on_tasks_next(_: CallbackQuery, __: Button, manager: DialogManager) -> None:
+    """
+    Переходит на следующую страницу задач.
+
+    Args:
+        _ (CallbackQuery): Колбэк от кнопки.
+        __ (Button): Кнопка листания.
+        manager (DialogManager): Менеджер диалога.
+    """
+    change_tasks_page(manager, 1)
+
+
+# Листание серверных страниц задач; геттер окна должен вернуть `tasks_pager_data`.
+TASKS_PAGER = Row(
+    Button(Const("◀️"), id="tasks_prev", on_click=_on_tasks_prev, when="tasks_has_prev"),
+    Button(Const("▶️"), id="tasks_next", on_click=_on_tasks_next, when="tasks_has_next"),
+)
+
+
+async def user_tasks_getter(dialog_manager: DialogManager, api: BackendAPI, **_: Any) -> dict[str, Any]:
+    """
+    Геттер окна выбора задачи для диалогов редактирования и смены статуса.
+
+    Сами задачи в `dialog_data` не сохраняются: обработчик выбора находит задачу
+    через `find_task` в кэше страниц `BackendAPI`.
+
+    Args:
+        dialog_manager (DialogManager): Менеджер текущего диалога.
+        api (BackendAPI): Общий клиент бэкенда.
+
+    Returns:
+        dict[str, Any]: Элементы для Select, текст списка, флаг наличия задач
+        и данные для `TASKS_PAGER`.
+    """
+    tasks = await get_tasks_cached(dialog_manager, api)
+    titles = [(str(task.get("id")), task.get("title", "Без названия")) for task in tasks]
+    items = [SelectItem(task_id, format_task_label(task_id, title)) for task_id, title in titles]
+    return {
+        "tasks": items,
+        "tasks_text": "\n".join(format_task_line(task_id, title) for task_id, title in titles)
+        or "Задач пока нет.",
+        "has_tasks": bool(items),
+        **tasks_pager_data(dialog_manager),
+    }
@@ -10,32 +10,32 @@ from services.api import BackendAPI
 
 router = Router(name="start")
 
+# Клавиатура не зависит от пользователя, поэтому строится один раз.
+MAIN_KEYBOARD = ReplyKeyboardMarkup(
+    keyboard=[
+        [KeyboardButton(text="Мои задачи")],
+        [KeyboardButton(text="Мои категории")],
+    ],
+    resize_keyboard=True,
+)
+
 
 @router.message(CommandStart())
-async def cmd_start(message: Message):
+async def cmd_start(message: Message, api: BackendAPI):
     """
     Обрабатывает команду /start.
 
     Args:
         message (Message): Объект сообщения Telegram.
+        api (BackendAPI): Общий клиент бэкенда.
 
     Raises:
         Exception: Ошибка при регистрации пользователя.
     """
     tg_id = message.from_user.id
     username = message.from_user.username
-    api = BackendAPI()
     try:
         await api.register(tg_id=tg_id, username=username)
-        kb = ReplyKeyboardMarkup(
-            keyboard=[
-                [KeyboardButton(text="Мои задачи")],
-                [KeyboardButton(text="Мои категории")],
-            ],
-            resize_keyboard=True,
-        )
-        await message.answer("Готово. Чем займёмся?", reply_markup=kb)
+        await message.answer("Готово. Чем займёмся?", reply_markup=MAIN_KEYBOARD)
     except Exception as e:
         await message.answer(f"Не удалось зарегистрироваться: {e}")
-    finally:
-        await api.aclose()
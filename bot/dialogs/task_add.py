@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-from aiogram import Router
+import asyncio
+from typing import Final
+
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message, CallbackQuery
 from aiogram_dialog import Dialog, Window
 from aiogram_dialog import DialogManager
 from aiogram_dialog.widgets.input import TextInput
-from aiogram_dialog.widgets.kbd import Button, Back, Cancel, Next, Select, ScrollingGroup
+from aiogram_dialog.widgets.kbd import Button, Next, Select, ScrollingGroup
 from aiogram_dialog.widgets.text import Const, Format
+from dialogs.common import BACK, CANCEL, ITEM_ID, ITEM_LABEL
 from services.api import BackendAPI
+from utils.dialog_cache import SelectItem, build_category_names
 
 from utils.dt import format_dt_user, parse_user_datetime
 
+# Совпадает с max_length поля Task.title на бэкенде.
+MAX_TASK_TITLE_LENGTH: Final[int] = 200
+
 
 class AddTaskSG(StatesGroup):
     """
@@ -45,7 +52,14 @@ async def on_title_input(m: Message, widget: TextInput, manager: DialogManager,
         manager (DialogManager): Менеджер диалога.
         text (str): Введенный текст заголовка задачи.
     """
-    manager.dialog_data["title"] = text.strip()
+    title = text.strip()
+    if not title:
+        await m.answer("Название не может быть пустым.")
+        return
+    if len(title) > MAX_TASK_TITLE_LENGTH:
+        await m.answer(f"Слишком длинно. Максимум {MAX_TASK_TITLE_LENGTH} символов.")
+        return
+    manager.dialog_data["title"] = title
     await manager.switch_to(AddTaskSG.description)
 
 
@@ -60,9 +74,24 @@ async def on_desc_input(m: Message, widget: TextInput, manager: DialogManager, t
         text (str): Введённый пользователем текст.
     """
     manager.dialog_data["description"] = text.strip()
+    _prefetch_categories(manager)
     await manager.switch_to(AddTaskSG.due_at)
 
 
+def _prefetch_categories(manager: DialogManager) -> None:
+    """
+    Запускает загрузку категорий, пока пользователь вводит срок задачи.
+
+    Если категории уже были показаны в этом диалоге, ничего не делает.
+
+    Args:
+        manager (DialogManager): Менеджер диалога.
+    """
+    if "cat_names" not in manager.dialog_data:
+        api: BackendAPI = manager.middleware_data["api"]
+        api.prefetch_categories(tg_id=manager.event.from_user.id)
+
+
 async def on_due_input(m: Message, widget: TextInput, manager: DialogManager, text: str):
     """
     Обрабатывает ввод даты и времени от пользователя, проверяет его корректность и обновляет данные диалога.
@@ -92,12 +121,13 @@ async def on_due_input(m: Message, widget: TextInput, manager: DialogManager, te
     await manager.switch_to(AddTaskSG.categories)
 
 
-async def categories_getter(dialog_manager: DialogManager, **kwargs):
+async def categories_getter(dialog_manager: DialogManager, api: BackendAPI, **kwargs):
     """
     Получает категории и сохраняет данные в dialog_manager.
 
     Args:
         dialog_manager (DialogManager): Менеджер диалогов.
+        api (BackendAPI): Общий клиент бэкенда.
         **kwargs: Дополнительные параметры.
 
     Returns:
@@ -107,32 +137,19 @@ async def categories_getter(dialog_manager: DialogManager, **kwargs):
     Raises:
         Исключения, связанные с обращением к BackendAPI.
     """
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        cats = await api.list_categories(tg_id=tg_id)  # [{id, name}, ...]
-        dialog_manager.dialog_data["cats_all"] = cats  # сохраним «сырые» из API
-
-        selected = set(dialog_manager.dialog_data.get("cats_sel", []))
-
-        items = []
-        for c in cats:
-            cid = c["id"]
-            items.append({
-                "id": cid,
-                "label": c["name"],
-                "check": "✅" if cid in selected else "☐",
-            })
-
-        sel_names = [c["name"] for c in cats if c["id"] in selected]
-        return {
-            "cats": items,                            # для Select
-            "selected": list(selected),               # если где-то нужно
-            "sel_count": len(selected),               # для хедера
-            "sel_list": ", ".join(sel_names) or "—",  # для хедера
-        }
-    finally:
-        await api.aclose()
+    cat_names = build_category_names(await api.list_categories(tg_id=dialog_manager.event.from_user.id))
+    dialog_manager.dialog_data["cat_names"] = cat_names  # для сводки нужны только названия
+
+    selected: dict[str, bool] = dialog_manager.dialog_data.get("cats_sel_map", {})
+
+    items = [SelectItem(cid, f"✅ {name}" if cid in selected else f"☐ {name}") for cid, name in cat_names.items()]
+    sel_names = [cat_names[cid] for cid in selected if cid in cat_names]
+    return {
+        "cats": items,                            # для Select
+        "selected": list(selected),               # если где-то нужно
+        "sel_count": len(selected),               # для хедера
+        "sel_list": ", ".join(sel_names) or "—",  # для хедера
+    }
 
 
 async def on_cat_select(c: CallbackQuery, widget: Select, manager: DialogManager, item_id: str):
@@ -145,9 +162,10 @@ async def on_cat_select(c: CallbackQuery, widget: Select, manager: DialogManager
         manager (DialogManager): Менеджер диалога для отслеживания состояния.
         item_id (str): Идентификатор выбранного элемента.
     """
-    sel = set(manager.dialog_data.get("cats_sel", []))
+    # Выбор хранится как dict (JSON-совместимое множество) и меняется на месте.
+    sel: dict[str, bool] = manager.dialog_data.setdefault("cats_sel_map", {})
     if item_id in sel:
-        sel.remove(item_id)
+        del sel[item_id]
     else:
         if len(sel) >= 3:
             try:
@@ -155,8 +173,7 @@ async def on_cat_select(c: CallbackQuery, widget: Select, manager: DialogManager
             except Exception:
                 pass
             return
-        sel.add(item_id)
-    manager.dialog_data["cats_sel"] = list(sel)
+        sel[item_id] = True
 
 
 async def confirm_getter(dialog_manager: DialogManager, **kwargs) -> dict[str, dict[str, str]]:
@@ -176,13 +193,11 @@ async def confirm_getter(dialog_manager: DialogManager, **kwargs) -> dict[str, d
     title = dialog_manager.dialog_data.get("title", "—")
     description = dialog_manager.dialog_data.get("description") or "—"
     due_at_iso = dialog_manager.dialog_data.get("due_at_iso")
-    categories_selected = set(dialog_manager.dialog_data.get("cats_sel", []))
-    categories_all = dialog_manager.dialog_data.get("cats_all", [])
+    categories_selected: dict[str, bool] = dialog_manager.dialog_data.get("cats_sel_map", {})
+    category_names: dict[str, str] = dialog_manager.dialog_data.get("cat_names", {})
 
     categories_readable_list = [
-        str(category.get("name", "—"))
-        for category in categories_all
-        if str(category.get("id")) in categories_selected
+        category_names[cid] for cid in categories_selected if cid in category_names
     ]
     categories_readable = ", ".join(categories_readable_list)
 
@@ -208,23 +223,28 @@ async def finalize_creation(c: CallbackQuery, widget: Button, manager: DialogMan
     title = manager.dialog_data.get("title")
     description = manager.dialog_data.get("description", "")
     due_at_iso = manager.dialog_data.get("due_at_iso")
-    categories = manager.dialog_data.get("cats_sel", [])
+    categories = list(manager.dialog_data.get("cats_sel_map", {}))
 
+    if not title:
+        await c.answer("Введите название.", show_alert=True)
+        return
     if len(categories) > 3:
         await c.answer("Нельзя больше 3 тегов. Уберите лишние.", show_alert=True)
         return
 
-    api = BackendAPI()
-    try:
-        created = await api.create_task(
+    api: BackendAPI = manager.middleware_data["api"]
+    created, _ = await asyncio.gather(
+        api.create_task(
             tg_id=tg_id, title=title, description=description, due_at_iso=due_at_iso, categories=categories
-        )
-        await c.message.answer(f"Задача создана: {created.get('title')}")
-    except Exception as e:
-        await c.message.answer(f"Ошибка создания: {e}")
-    finally:
-        await api.aclose()
-    await manager.done()
+        ),
+        c.answer(),
+        return_exceptions=True,
+    )
+    if isinstance(created, Exception):
+        await c.message.answer(f"Ошибка создания: {created}")
+        await manager.done()
+        return
+    await asyncio.gather(c.message.answer(f"Задача создана: {created.get('title')}"), manager.done())
 
 
 async def skip_desc(c: CallbackQuery, widget: Button, manager: DialogManager) -> None:
@@ -237,6 +257,7 @@ async def skip_desc(c: CallbackQuery, widget: Button, manager: DialogManager) ->
         manager (DialogManager): Менеджер диалога.
     """
     manager.dialog_data["description"] = ""
+    _prefetch_categories(manager)
     await manager.switch_to(AddTaskSG.due_at)
 
 
@@ -257,23 +278,23 @@ add_task_dialog = Dialog(
     Window(
         Const("Название задачи:"),
         TextInput(id="title_input", on_success=on_title_input),
-        Cancel(Const("Отмена")),
+        CANCEL,
         state=AddTaskSG.title,
     ),
     Window(
         Const("Описание (или оставь пустым):"),
         TextInput(id="desc_input", on_success=on_desc_input),
         Button(Const("Пропустить"), id="skip_desc", on_click=skip_desc),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=AddTaskSG.description,
     ),
     Window(
         Const("Дедлайн (формат 31.12.2025 14:30) — можно пропустить:"),
         TextInput(id="due_input", on_success=on_due_input),
         Button(Const("Пропустить"), id="skip_due", on_click=skip_due),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=AddTaskSG.due_at,
     ),
     Window(
@@ -282,9 +303,9 @@ add_task_dialog = Dialog(
         Format("Теги: {sel_list}"),
         ScrollingGroup(
             Select(
-                Format("{item[check]} {item[label]}"),
+                ITEM_LABEL,
                 id="cats_select",
-                item_id_getter=lambda x: x["id"],
+                item_id_getter=ITEM_ID,
                 items="cats",
                 on_click=on_cat_select,
             ),
@@ -292,8 +313,8 @@ add_task_dialog = Dialog(
             width=1, height=6,
         ),
         Next(Const("Далее")),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         getter=categories_getter,
         state=AddTaskSG.categories,
     ),
@@ -304,11 +325,9 @@ add_task_dialog = Dialog(
         Format("Дедлайн: {summary[due_at]}"),
         Format("Категории: {summary[categories]}"),
         Button(Const("Создать"), id="create_btn", on_click=finalize_creation),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         getter=confirm_getter,
         state=AddTaskSG.confirm,
     ),
 )
-
-router = Router(name="add_task")
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
-from aiogram import Router
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery
 from aiogram_dialog import Dialog, DialogManager, Window
-from aiogram_dialog.widgets.kbd import Back, Button, Cancel, ScrollingGroup, Select
+from aiogram_dialog.widgets.kbd import Button, ScrollingGroup, Select
 from aiogram_dialog.widgets.text import Const, Format
+from dialogs.common import BACK, CANCEL, ITEM_ID, ITEM_LABEL, TASKS_PAGER
 from services.api import BackendAPI, BackendError
+from utils.dialog_cache import (
+    SelectItem,
+    format_task_label,
+    find_task,
+    get_tasks_cached,
+    tasks_pager_data,
+)
 
 
 class DeleteTaskSG(StatesGroup):
@@ -27,43 +35,50 @@ class DeleteTaskSG(StatesGroup):
     confirm = State()
 
 
-async def tasks_getter(dialog_manager: DialogManager, **_: Any) -> dict[str, Any]:
+async def tasks_getter(dialog_manager: DialogManager, api: BackendAPI, **_: Any) -> dict[str, Any]:
     """
     Получить список задач для диалог-менеджера.
 
     Функция обращается к API для получения списка задач пользователя, форматирует
-    их и сохраняет сырые данные в диалоге. Возвращает задачи в виде списка словарей
-    с идентификатором и меткой, текстовым списком задач и флагом наличия задач.
+    их и сохраняет заголовки в диалоге. Возвращает задачи в виде списка словарей
+    с идентификатором и меткой и флагами наличия задач.
 
     Args:
         dialog_manager (DialogManager): Менеджер диалогов пользователя.
+        api (BackendAPI): Общий клиент бэкенда.
         **_ (Any): Дополнительные параметры, которые игнорируются.
 
     Returns:
-        dict[str, Any]: Словарь с форматированными задачами, текстовым представлением
-        задач и булевым флагом наличия задач.
+        dict[str, Any]: Словарь с форматированными задачами и флагами "has_tasks"
+        и "no_tasks".
     """
 
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        response = await api.list_tasks(tg_id=tg_id, page=1)
-        tasks: list[dict[str, Any]] = response.get("results", [])
-        dialog_manager.dialog_data["tasks_raw"] = tasks
-        items: list[dict[str, str]] = []
-        lines: list[str] = []
-        for task in tasks:
-            task_id = str(task.get("id"))
-            title = task.get("title", "Без названия")
-            items.append({"id": task_id, "label": f"#{task_id} — {title}"})
-            lines.append(f"#{task_id}: {title}")
-        return {
-            "tasks": items,
-            "tasks_text": "\n".join(lines) if lines else "Задач пока нет.",
-            "has_tasks": bool(items),
-        }
-    finally:
-        await api.aclose()
+    tasks = await get_tasks_cached(dialog_manager, api)
+    items: list[SelectItem] = []
+    append = items.append
+    for task in tasks:
+        task_id = str(task.get("id"))
+        append(SelectItem(task_id, format_task_label(task_id, task.get("title", "Без названия"))))
+    has_tasks = bool(items)
+    return {
+        "tasks": items,
+        "has_tasks": has_tasks,
+        "no_tasks": not has_tasks,
+        **tasks_pager_data(dialog_manager),
+    }
+
+
+async def on_refresh(callback: CallbackQuery, _: Button, manager: DialogManager) -> None:
+    """
+    Сбрасывает кэш страниц задач, чтобы окно при перерисовке загрузило свежий список.
+
+    Args:
+        callback (CallbackQuery): Колбэк от кнопки.
+        _ (Button): Кнопка обновления.
+        manager (DialogManager): Менеджер диалога.
+    """
+    api: BackendAPI = manager.middleware_data["api"]
+    api.invalidate_tasks(tg_id=callback.from_user.id)
 
 
 async def on_task_selected(
@@ -84,15 +99,15 @@ async def on_task_selected(
     Raises:
         Any: Показывает сообщение об ошибке, если задача не найдена.
     """
-    tasks: list[dict[str, Any]] = manager.dialog_data.get("tasks_raw", [])
-    selected = next((task for task in tasks if str(task.get("id")) == item_id), None)
+    api: BackendAPI = manager.middleware_data["api"]
+    selected = await find_task(manager, api, item_id)
     if selected is None:
         await callback.answer("Не удалось найти задачу", show_alert=True)
         return
 
     manager.dialog_data.update(
         {
-            "task_id": str(selected.get("id")),
+            "task_id": item_id,
             "task_title": selected.get("title", "Без названия"),
         }
     )
@@ -124,57 +139,60 @@ async def confirm_delete(
         await callback.answer("Не выбрана задача", show_alert=True)
         return
 
-    api = BackendAPI()
-    try:
-        await api.delete_task(tg_id=tg_id, task_id=task_id)
-    except BackendError as exc:
-        message = str(exc)
-        if message.startswith("404"):
+    api: BackendAPI = manager.middleware_data["api"]
+    # Колбэк подтверждаем параллельно с удалением, поэтому ошибки дальше
+    # сообщаются только текстом, без всплывающего окна.
+    result, _ = await asyncio.gather(
+        api.delete_task(tg_id=tg_id, task_id=task_id),
+        callback.answer(),
+        return_exceptions=True,
+    )
+    if isinstance(result, BackendError):
+        message = str(result)
+        if result.status == 404:
             user_message = "Задача уже удалена или недоступна."
         else:
             user_message = f"Ошибка удаления: {message}"
-        await callback.answer("Не удалось удалить", show_alert=True)
         await callback.message.answer(user_message)
         return
-    except Exception as exc:  # pragma: no cover - страховка на непредвиденные ошибки
-        await callback.answer("Не удалось удалить", show_alert=True)
-        await callback.message.answer(f"Непредвиденная ошибка: {exc}")
+    if isinstance(result, Exception):  # pragma: no cover - страховка на непредвиденные ошибки
+        await callback.message.answer(f"Непредвиденная ошибка: {result}")
         return
-    finally:
-        await api.aclose()
 
-    await callback.message.answer(f"Задача #{task_id} успешно удалена.")
-    await manager.done()
+    await asyncio.gather(
+        callback.message.answer(f"Задача #{task_id} успешно удалена."),
+        manager.done(),
+    )
 
 
 delete_task_dialog = Dialog(
     Window(
         Const("Выбери задачу для удаления:"),
-        Format("{tasks_text}"),
         ScrollingGroup(
             Select(
-                Format("{item[label]}"),
+                ITEM_LABEL,
                 id="delete_tasks_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="tasks",
                 on_click=on_task_selected,
             ),
             id="delete_tasks_scroll",
             width=1,
-            height=8,
+            height=10,
             when="has_tasks",
         ),
-        Cancel(Const("Отмена")),
+        TASKS_PAGER,
+        Const("Задач пока нет.", when="no_tasks"),
+        Button(Const("Обновить"), id="delete_tasks_refresh", on_click=on_refresh),
+        CANCEL,
         state=DeleteTaskSG.choose_task,
         getter=tasks_getter,
     ),
     Window(
         Format("Удалить задачу #{dialog_data[task_id]} — {dialog_data[task_title]}?"),
         Button(Const("Удалить"), id="confirm_delete_btn", on_click=confirm_delete),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=DeleteTaskSG.confirm,
     ),
 )
-
-router = Router(name="delete_task")
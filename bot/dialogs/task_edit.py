@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, Final
 
 from aiogram import Router
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import Dialog, DialogManager, Window
 from aiogram_dialog.widgets.input import TextInput
-from aiogram_dialog.widgets.kbd import Back, Button, Cancel, Next, ScrollingGroup, Select
+from aiogram_dialog.widgets.kbd import Button, Next, ScrollingGroup, Select
 from aiogram_dialog.widgets.text import Const, Format
+from dialogs.common import BACK, CANCEL, ITEM_ID, ITEM_LABEL, TASKS_PAGER, user_tasks_getter
 from services.api import BackendAPI
+from utils.dialog_cache import SelectItem, build_category_names, find_task
 
 from utils.dt import format_dt_user, parse_user_datetime
 
+# Ключи `dialog_data` с изменёнными пользователем полями и соответствующие им поля
+# исходной задачи в `dialog_data["original"]`. Ключ появляется, только если поле меняли.
+EDITED_FIELDS: Final[dict[str, str]] = {
+    "title": "title",
+    "description": "description",
+    "due_at_iso": "due_at",
+}
+
+
+def current_value(dialog_data: dict[str, Any], key: str) -> Any:
+    """
+    Возвращает значение редактируемого поля с учётом изменений пользователя.
+
+    Args:
+        dialog_data (dict[str, Any]): Данные диалога.
+        key (str): Ключ поля из `EDITED_FIELDS`.
+
+    Returns:
+        Any: Новое значение поля, если его меняли, иначе исходное значение задачи.
+    """
+    if key in dialog_data:
+        return dialog_data[key]
+    return dialog_data.get("original", {}).get(EDITED_FIELDS[key])
+
 
 class EditTaskSG(StatesGroup):
     """
@@ -39,46 +66,6 @@ class EditTaskSG(StatesGroup):
     confirm = State()
 
 
-async def tasks_getter(dialog_manager: DialogManager, **kwargs: Any) -> dict[str, Any]:
-    """
-    Получает задачи пользователя с бэкенда и формирует данные для диалога.
-
-    Args:
-        dialog_manager (DialogManager): Управляет состоянием текущего диалога.
-        **kwargs (Any): Дополнительные аргументы.
-
-    Returns:
-        dict[str, Any]: Данные, содержащие задачи, текстовое представление задач
-        и информацию о наличии задач.
-
-    Raises:
-        None: Исключения не выбрасываются явно.
-    """
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        resp = await api.list_tasks(tg_id=tg_id, page=1)
-        tasks: list[dict[str, Any]] = resp.get("results", [])
-        dialog_manager.dialog_data["tasks_raw"] = tasks
-        items: list[dict[str, str]] = []
-        lines: list[str] = []
-        for task in tasks:
-            task_id = str(task.get("id"))
-            title = task.get("title", "Без названия")
-            items.append({
-                "id": task_id,
-                "label": f"#{task_id} — {title}",
-            })
-            lines.append(f"#{task_id}: {title}")
-        return {
-            "tasks": items,
-            "tasks_text": "\n".join(lines) if lines else "Задач пока нет.",
-            "has_tasks": bool(items),
-        }
-    finally:
-        await api.aclose()
-
-
 async def on_task_selected(
         callback: CallbackQuery,
         widget: Select,
@@ -97,28 +84,28 @@ async def on_task_selected(
     Raises:
         ValueError: Если задача с указанным идентификатором не найдена.
     """
-    tasks: list[dict[str, Any]] = manager.dialog_data.get("tasks_raw", [])
-    selected = next((task for task in tasks if str(task.get("id")) == item_id), None)
+    api: BackendAPI = manager.middleware_data["api"]
+    selected = await find_task(manager, api, item_id)
     if selected is None:
         await callback.answer("Не удалось найти задачу", show_alert=True)
         return
 
-    categories = selected.get("categories") or [
+    # Id категорий приводятся к строкам один раз здесь; дальше диалог работает только со строками.
+    categories = [str(cat_id) for cat_id in selected.get("categories") or ()] or [
         str(cat.get("id")) for cat in selected.get("categories_detail", []) if cat.get("id")
     ]
 
+    for key in EDITED_FIELDS:
+        manager.dialog_data.pop(key, None)
     manager.dialog_data.update(
         {
-            "task_id": str(selected.get("id")),
-            "title": selected.get("title", ""),
-            "description": selected.get("description", ""),
-            "due_at_iso": selected.get("due_at"),
-            "cats_sel": [str(cat_id) for cat_id in categories] if categories else [],
+            "task_id": item_id,
+            "cats_sel": categories.copy(),
             "original": {
                 "title": selected.get("title", ""),
                 "description": selected.get("description", ""),
                 "due_at": selected.get("due_at"),
-                "categories": [str(cat_id) for cat_id in categories] if categories else [],
+                "categories": categories,
             },
         }
     )
@@ -151,7 +138,7 @@ async def on_title_input(message: Message, widget: TextInput, manager: DialogMan
 
 async def keep_title(_: CallbackQuery, __: Button, manager: DialogManager) -> None:
     """
-    Сохраняет заголовок в данных диалога и переключает на этап редактирования описания.
+    Оставляет исходное название задачи и переключает на этап редактирования описания.
 
     Args:
         _: CallbackQuery: Объект запроса обратного вызова.
@@ -164,7 +151,7 @@ async def keep_title(_: CallbackQuery, __: Button, manager: DialogManager) -> No
     Raises:
         Ничего не выбрасывает.
     """
-    manager.dialog_data["title"] = manager.dialog_data.get("original", {}).get("title", "")
+    manager.dialog_data.pop("title", None)
     await manager.switch_to(EditTaskSG.description)
 
 
@@ -190,7 +177,7 @@ async def on_description_input(
 
 async def keep_description(_: CallbackQuery, __: Button, manager: DialogManager) -> None:
     """
-    Сохраняет описание задачи и переключает состояние диалога.
+    Оставляет исходное описание задачи и переключает состояние диалога.
 
     Args:
         _: CallbackQuery: Ответ на нажатие кнопки.
@@ -198,7 +185,7 @@ async def keep_description(_: CallbackQuery, __: Button, manager: DialogManager)
         manager: DialogManager: Менеджер текущего диалога.
 
     """
-    manager.dialog_data["description"] = manager.dialog_data.get("original", {}).get("description", "")
+    manager.dialog_data.pop("description", None)
     await manager.switch_to(EditTaskSG.due_at)
 
 
@@ -233,7 +220,7 @@ async def on_due_input(message: Message, widget: TextInput, manager: DialogManag
     """
     text = text.strip()
     if not text:
-        manager.dialog_data["due_at_iso"] = manager.dialog_data.get("original", {}).get("due_at")
+        manager.dialog_data.pop("due_at_iso", None)
         await manager.switch_to(EditTaskSG.categories)
         return
     try:
@@ -247,7 +234,7 @@ async def on_due_input(message: Message, widget: TextInput, manager: DialogManag
 
 async def keep_due(_: CallbackQuery, __: Button, manager: DialogManager) -> None:
     """
-    Сохраняет исходную дату выполнения задачи и переключает диалог на выбор категорий.
+    Оставляет исходную дату выполнения задачи и переключает диалог на выбор категорий.
 
     Args:
         _: CallbackQuery: Объект обратного вызова (не используется).
@@ -257,7 +244,7 @@ async def keep_due(_: CallbackQuery, __: Button, manager: DialogManager) -> None
     Returns:
         None
     """
-    manager.dialog_data["due_at_iso"] = manager.dialog_data.get("original", {}).get("due_at")
+    manager.dialog_data.pop("due_at_iso", None)
     await manager.switch_to(EditTaskSG.categories)
 
 
@@ -274,11 +261,12 @@ async def clear_due(_: CallbackQuery, __: Button, manager: DialogManager) -> Non
     await manager.switch_to(EditTaskSG.categories)
 
 
-async def categories_getter(dialog_manager: DialogManager, **kwargs: Any) -> dict[str, Any]:
+async def categories_getter(dialog_manager: DialogManager, api: BackendAPI, **kwargs: Any) -> dict[str, Any]:
     """Возвращает информацию о категориях и выбранных элементах.
 
     Args:
         dialog_manager (DialogManager): Объект менеджера диалога.
+        api (BackendAPI): Общий клиент бэкенда.
         **kwargs: Дополнительные аргументы.
 
     Returns:
@@ -288,31 +276,18 @@ async def categories_getter(dialog_manager: DialogManager, **kwargs: Any) -> dic
     Raises:
         Исключения, связанные с взаимодействием с BackendAPI.
     """
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        cats = await api.list_categories(tg_id=tg_id)
-        dialog_manager.dialog_data["cats_all"] = cats
-        selected = set(str(cat_id) for cat_id in dialog_manager.dialog_data.get("cats_sel", []))
-        items: list[dict[str, str]] = []
-        for cat in cats:
-            cat_id = str(cat["id"])
-            is_selected = cat_id in selected
-            items.append(
-                {
-                    "id": cat_id,
-                    "label": cat["name"],
-                    "check": "✅" if is_selected else "☐",
-                }
-            )
-        selected_names = [cat["name"] for cat in cats if str(cat["id"]) in selected]
-        return {
-            "cats": items,
-            "sel_count": len(selected),
-            "sel_list": ", ".join(selected_names) or "—",
-        }
-    finally:
-        await api.aclose()
+    cat_names = build_category_names(await api.list_categories(tg_id=dialog_manager.event.from_user.id))
+    dialog_manager.dialog_data["cat_names"] = cat_names
+    selected = set(dialog_manager.dialog_data.get("cats_sel", ()))
+    items = [
+        SelectItem(cat_id, f"✅ {name}" if cat_id in selected else f"☐ {name}") for cat_id, name in cat_names.items()
+    ]
+    selected_names = [cat_names[cat_id] for cat_id in selected if cat_id in cat_names]
+    return {
+        "cats": items,
+        "sel_count": len(selected),
+        "sel_list": ", ".join(selected_names) or "—",
+    }
 
 
 async def on_category_toggle(
@@ -333,15 +308,18 @@ async def on_category_toggle(
     Raises:
         CallbackQuery.answer: Если количество выбранных категорий превышает 3.
     """
-    selected = set(manager.dialog_data.get("cats_sel", []))
+    # Повторная доставка того же колбэка не должна снова переключать категорию.
+    if manager.dialog_data.get("last_toggle") == callback.id:
+        return
+    manager.dialog_data["last_toggle"] = callback.id
+    # Выбрано не больше трёх категорий, поэтому поиск по списку дешевле построения множества.
+    selected: list[str] = manager.dialog_data.setdefault("cats_sel", [])
     if item_id in selected:
         selected.remove(item_id)
+    elif len(selected) >= 3:
+        await callback.answer("Можно выбрать не более 3 категорий.", show_alert=True)
     else:
-        if len(selected) >= 3:
-            await callback.answer("Можно выбрать не более 3 категорий.", show_alert=True)
-            return
-        selected.add(item_id)
-    manager.dialog_data["cats_sel"] = list(selected)
+        selected.append(item_id)
 
 
 async def finalize_edit(callback: CallbackQuery, button: Button, manager: DialogManager) -> None:
@@ -361,21 +339,16 @@ async def finalize_edit(callback: CallbackQuery, button: Button, manager: Dialog
         await callback.answer("Задача не выбрана", show_alert=True)
         return
     original: dict[str, Any] = manager.dialog_data.get("original", {})
-    title = manager.dialog_data.get("title", original.get("title", ""))
-    description = manager.dialog_data.get("description", original.get("description", ""))
-    due_at_iso = manager.dialog_data.get("due_at_iso", original.get("due_at"))
     categories_raw = manager.dialog_data.get("cats_sel", original.get("categories", []))
-    new_categories = [str(cat_id) for cat_id in categories_raw]
-    original_categories = [str(cat_id) for cat_id in original.get("categories", [])]
-
-    payload: dict[str, Any] = {}
-    if title != original.get("title"):
-        payload["title"] = title
-    if description != original.get("description"):
-        payload["description"] = description
-    if due_at_iso != original.get("due_at"):
-        payload["due_at"] = due_at_iso
-    if sorted(new_categories) != sorted(original_categories):
+    new_categories = list(categories_raw)
+    original_categories = set(original.get("categories", ()))
+
+    payload: dict[str, Any] = {
+        field: manager.dialog_data[key]
+        for key, field in EDITED_FIELDS.items()
+        if key in manager.dialog_data and manager.dialog_data[key] != original.get(field)
+    }
+    if set(new_categories) != original_categories:
         payload["categories"] = new_categories
 
     if not payload:
@@ -383,16 +356,19 @@ async def finalize_edit(callback: CallbackQuery, button: Button, manager: Dialog
         await manager.done()
         return
 
-    api = BackendAPI()
+    api: BackendAPI = manager.middleware_data["api"]
     tg_id = manager.event.from_user.id
-    try:
-        await api.patch_task(tg_id=tg_id, task_id=str(task_id), **payload)
-        await callback.message.answer("Задача обновлена.")
-    except Exception as exc:  # noqa: BLE001
-        await callback.message.answer(f"Ошибка обновления: {exc}")
-    finally:
-        await api.aclose()
-    await manager.done()
+    # Колбэк подтверждаем параллельно с записью, не дожидаясь ответа бэкенда.
+    result, _ = await asyncio.gather(
+        api.patch_task(tg_id=tg_id, task_id=task_id, **payload),
+        callback.answer(),
+        return_exceptions=True,
+    )
+    if isinstance(result, Exception):
+        result_text = f"Ошибка обновления: {result}"
+    else:
+        result_text = "Задача обновлена."
+    await asyncio.gather(callback.message.answer(result_text), manager.done())
 
 
 def build_summary(dialog_data: dict[str, Any]) -> str:
@@ -405,13 +381,13 @@ def build_summary(dialog_data: dict[str, Any]) -> str:
     Returns:
         str: Форматированное строковое представление данных о диалоге.
     """
-    title = dialog_data.get("title", "—")
-    description = dialog_data.get("description", "—") or "—"
-    due_at_iso = dialog_data.get("due_at_iso")
+    title = current_value(dialog_data, "title") or "—"
+    description = current_value(dialog_data, "description") or "—"
+    due_at_iso = current_value(dialog_data, "due_at_iso")
     due_at = format_dt_user(due_at_iso) if due_at_iso else "—"
-    cats_all = dialog_data.get("cats_all", [])
-    cats_sel = {str(cat_id) for cat_id in dialog_data.get("cats_sel", [])}
-    cats_names = [cat["name"] for cat in cats_all if str(cat["id"]) in cats_sel]
+    cat_names: dict[str, str] = dialog_data.get("cat_names", {})
+    get_name = cat_names.get
+    cats_names = [name for cat_id in dialog_data.get("cats_sel", ()) if (name := get_name(cat_id))]
     cats_display = ", ".join(cats_names) if cats_names else "—"
     return (
         f"Название: {title}\n"
@@ -432,7 +408,7 @@ def due_hint(dialog_data: dict[str, Any]) -> str:
         str: Дата завершения задачи в формате пользователя или сообщение "не задан",
         если дата отсутствует.
     """
-    due_at_iso = dialog_data.get("due_at_iso") or dialog_data.get("original", {}).get("due_at")
+    due_at_iso = current_value(dialog_data, "due_at_iso")
     if due_at_iso:
         return format_dt_user(due_at_iso)
     return "не задан"
@@ -449,11 +425,7 @@ async def title_getter(dialog_manager: DialogManager, **kwargs: Any) -> dict[str
     Returns:
         dict[str, Any]: Словарь с ключом "current_title", содержащим заголовок или дефолтное значение "—".
     """
-    title = dialog_manager.dialog_data.get("title")
-    if title:
-        return {"current_title": title}
-    original = dialog_manager.dialog_data.get("original", {})
-    return {"current_title": original.get("title", "—") or "—"}
+    return {"current_title": current_value(dialog_manager.dialog_data, "title") or "—"}
 
 
 async def description_getter(dialog_manager: DialogManager, **kwargs: Any) -> dict[str, Any]:
@@ -468,12 +440,7 @@ async def description_getter(dialog_manager: DialogManager, **kwargs: Any) -> di
         dict[str, Any]: Словарь с текущим описанием.
 
     """
-    description = dialog_manager.dialog_data.get("description")
-    if description:
-        return {"current_description": description}
-    original = dialog_manager.dialog_data.get("original", {})
-    original_description = original.get("description") or "—"
-    return {"current_description": original_description}
+    return {"current_description": current_value(dialog_manager.dialog_data, "description") or "—"}
 
 
 async def due_getter(dialog_manager: DialogManager, **kwargs: Any) -> dict[str, Any]:
@@ -510,28 +477,29 @@ edit_task_dialog = Dialog(
         Format("{tasks_text}"),
         ScrollingGroup(
             Select(
-                Format("{item[label]}"),
+                ITEM_LABEL,
                 id="tasks_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="tasks",
                 on_click=on_task_selected,
             ),
             id="tasks_scroll",
             width=1,
-            height=8,
+            height=10,
             when="has_tasks",
         ),
-        Cancel(Const("Отмена")),
+        TASKS_PAGER,
+        CANCEL,
         state=EditTaskSG.choose_task,
-        getter=tasks_getter,
+        getter=user_tasks_getter,
     ),
     Window(
         Format("Текущее название: {current_title}"),
         Const("Введи новое название или нажми «Пропустить»."),
         TextInput(id="title_input", on_success=on_title_input),
         Button(Const("Пропустить"), id="skip_title", on_click=keep_title),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditTaskSG.title,
         getter=title_getter,
     ),
@@ -541,8 +509,8 @@ edit_task_dialog = Dialog(
         TextInput(id="desc_input", on_success=on_description_input),
         Button(Const("Пропустить"), id="skip_desc", on_click=keep_description),
         Button(Const("Очистить"), id="clear_desc", on_click=clear_description),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditTaskSG.description,
         getter=description_getter,
     ),
@@ -552,8 +520,8 @@ edit_task_dialog = Dialog(
         TextInput(id="due_input", on_success=on_due_input),
         Button(Const("Пропустить"), id="skip_due", on_click=keep_due),
         Button(Const("Очистить"), id="clear_due", on_click=clear_due),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditTaskSG.due_at,
         getter=due_getter,
     ),
@@ -563,9 +531,9 @@ edit_task_dialog = Dialog(
         Format("Теги: {sel_list}"),
         ScrollingGroup(
             Select(
-                Format("{item[check]} {item[label]}"),
+                ITEM_LABEL,
                 id="cats_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="cats",
                 on_click=on_category_toggle,
             ),
@@ -574,8 +542,8 @@ edit_task_dialog = Dialog(
             height=6,
         ),
         Next(Const("Далее")),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditTaskSG.categories,
         getter=categories_getter,
     ),
@@ -583,8 +551,8 @@ edit_task_dialog = Dialog(
         Const("Проверь изменения:"),
         Format("{summary}"),
         Button(Const("Сохранить"), id="save_task", on_click=finalize_edit),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=EditTaskSG.confirm,
         getter=summary_getter,
     ),
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from aiogram import Router
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import CallbackQuery
 from aiogram_dialog import Dialog, DialogManager, Window
-from aiogram_dialog.widgets.kbd import Back, Cancel, ScrollingGroup, Select
+from aiogram_dialog.widgets.kbd import ScrollingGroup, Select
 from aiogram_dialog.widgets.text import Const, Format
 
+from dialogs.common import BACK, CANCEL, ITEM_ID, ITEM_LABEL, TASKS_PAGER, user_tasks_getter
 from services.api import BackendAPI, BackendError
-from utils.fmt import STATUS_PRESENTATION
+from utils.dialog_cache import SelectItem, find_task
+from utils.fmt import STATUS_DEFAULT, STATUS_PRESENTATION
+
+# Список статусов не меняется, при отрисовке помечается только текущий.
+_STATUS_ITEMS: tuple[SelectItem, ...] = tuple(
+    SelectItem(status, f"{icon} {label}") for status, (icon, label) in STATUS_PRESENTATION.items()
+)
 
 
 class ChangeTaskStatusSG(StatesGroup):
@@ -30,42 +38,6 @@ class ChangeTaskStatusSG(StatesGroup):
     choose_status = State()
 
 
-async def tasks_getter(dialog_manager: DialogManager, **_: Any) -> dict[str, Any]:
-    """
-    Получает список задач для заданного пользователя.
-
-    Args:
-        dialog_manager (DialogManager): Менеджер диалога Telegram.
-        **_ (Any): Дополнительные параметры.
-
-    Returns:
-        dict[str, Any]: Словарь с задачами, текстовым представлением задач и флагом наличия задач.
-
-    Raises:
-        Исключение: При ошибке запроса к API.
-    """
-    api = BackendAPI()
-    tg_id = dialog_manager.event.from_user.id
-    try:
-        response = await api.list_tasks(tg_id=tg_id, page=1)
-        tasks: list[dict[str, Any]] = response.get("results", [])
-        dialog_manager.dialog_data["tasks_raw"] = tasks
-        items: list[dict[str, str]] = []
-        lines: list[str] = []
-        for task in tasks:
-            task_id = str(task.get("id"))
-            title = task.get("title", "Без названия")
-            items.append({"id": task_id, "label": f"#{task_id} — {title}"})
-            lines.append(f"#{task_id}: {title}")
-        return {
-            "tasks": items,
-            "tasks_text": "\n".join(lines) if lines else "Задач пока нет.",
-            "has_tasks": bool(items),
-        }
-    finally:
-        await api.aclose()
-
-
 async def on_task_selected(
     callback: CallbackQuery,
     _: Select,
@@ -87,15 +59,15 @@ async def on_task_selected(
     Raises:
         CallbackAnswer: Возникает при отсутствии задачи с переданным идентификатором в списке.
     """
-    tasks: list[dict[str, Any]] = manager.dialog_data.get("tasks_raw", [])
-    selected = next((task for task in tasks if str(task.get("id")) == item_id), None)
+    api: BackendAPI = manager.middleware_data["api"]
+    selected = await find_task(manager, api, item_id)
     if selected is None:
         await callback.answer("Не удалось найти задачу", show_alert=True)
         return
 
     manager.dialog_data.update(
         {
-            "task_id": str(selected.get("id")),
+            "task_id": item_id,
             "task_title": selected.get("title", "Без названия"),
             "current_status": selected.get("status"),
         }
@@ -117,10 +89,10 @@ async def statuses_getter(dialog_manager: DialogManager, **_: Any) -> dict[str,
         указывает наличие статусов (True, если они присутствуют, иначе False).
     """
     current_status = str(dialog_manager.dialog_data.get("current_status") or "")
-    statuses: list[dict[str, str]] = []
-    for status, (icon, label) in STATUS_PRESENTATION.items():
-        suffix = " (текущий)" if status == current_status else ""
-        statuses.append({"id": status, "label": f"{icon} {label}{suffix}"})
+    statuses = [
+        item._replace(label=f"{item.label} (текущий)") if item.id == current_status else item
+        for item in _STATUS_ITEMS
+    ]
     return {"statuses": statuses, "has_statuses": bool(statuses)}
 
 
@@ -155,24 +127,27 @@ async def on_status_selected(
         await callback.answer("Этот статус уже установлен", show_alert=True)
         return
 
-    api = BackendAPI()
+    api: BackendAPI = manager.middleware_data["api"]
     tg_id = callback.from_user.id
-    try:
-        await api.patch_task(tg_id=tg_id, task_id=str(task_id), status=item_id)
-    except BackendError as exc:
-        await callback.answer("Не удалось обновить", show_alert=True)
-        await callback.message.answer(f"Ошибка обновления статуса: {exc}")
+    # Колбэк подтверждаем параллельно с записью, поэтому ошибка сообщается
+    # только текстом, без всплывающего окна.
+    result, _ = await asyncio.gather(
+        api.patch_task(tg_id=tg_id, task_id=task_id, status=item_id),
+        callback.answer(),
+        return_exceptions=True,
+    )
+    if isinstance(result, BackendError):
+        await callback.message.answer(f"Ошибка обновления статуса: {result}")
         return
-    finally:
-        await api.aclose()
+    if isinstance(result, Exception):
+        raise result
 
     manager.dialog_data["current_status"] = item_id
-    icon, label = STATUS_PRESENTATION.get(item_id, ("⚪️", "Неизвестный статус"))
-    await callback.answer()
-    await callback.message.answer(
-        f"Статус задачи #{task_id} — {task_title} обновлён на: {icon} {label}"
+    icon, label = STATUS_PRESENTATION.get(item_id, STATUS_DEFAULT)
+    await asyncio.gather(
+        callback.message.answer(f"Статус задачи #{task_id} — {task_title} обновлён на: {icon} {label}"),
+        manager.done(),
     )
-    await manager.done()
 
 
 change_task_status_dialog = Dialog(
@@ -181,20 +156,21 @@ change_task_status_dialog = Dialog(
         Format("{tasks_text}"),
         ScrollingGroup(
             Select(
-                Format("{item[label]}"),
+                ITEM_LABEL,
                 id="change_status_tasks_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="tasks",
                 on_click=on_task_selected,
             ),
             id="change_status_tasks_scroll",
             width=1,
-            height=8,
+            height=10,
             when="has_tasks",
         ),
-        Cancel(Const("Отмена")),
+        TASKS_PAGER,
+        CANCEL,
         state=ChangeTaskStatusSG.choose_task,
-        getter=tasks_getter,
+        getter=user_tasks_getter,
     ),
     Window(
         Format(
@@ -203,9 +179,9 @@ change_task_status_dialog = Dialog(
         ),
         ScrollingGroup(
             Select(
-                Format("{item[label]}"),
+                ITEM_LABEL,
                 id="status_select",
-                item_id_getter=lambda item: item["id"],
+                item_id_getter=ITEM_ID,
                 items="statuses",
                 on_click=on_status_selected,
             ),
@@ -214,8 +190,8 @@ change_task_status_dialog = Dialog(
             height=8,
             when="has_statuses",
         ),
-        Back(Const("Назад")),
-        Cancel(Const("Отмена")),
+        BACK,
+        CANCEL,
         state=ChangeTaskStatusSG.choose_status,
         getter=statuses_getter,
     ),
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from itertools import islice
+
 from aiogram import F, Router
 from aiogram.types import Message
 from services.api import BackendAPI
@@ -10,42 +13,45 @@ from utils.fmt import fmt_task_line
 
 router = Router(name="tasks")
 
+TASKS_PREVIEW_LIMIT = 10
+# Подсказки по командам отправляются одним сообщением после списка задач.
+TASKS_COMMANDS_HINT = (
+    "Для добавления задачи воспользуйся командой /add.\n"
+    "Для редактирования задачи воспользуйся командой /edittask.\n"
+    "Для редактирования статуса задачи воспользуйся командой /status.\n"
+    "Для удаления задачи воспользуйся командой /deltask."
+)
+
 
-@router.message(F.text == "Мои задачи")
-async def list_tasks(message: Message):
+async def list_tasks(message: Message, api: BackendAPI):
     """
     Обрабатывает запрос пользователя на отображение списка задач.
 
     Args:
         message (Message): Сообщение от пользователя, содержащее текст команды.
+        api (BackendAPI): Общий клиент бэкенда.
 
     Raises:
         Exception: Если возникла ошибка при запросе списка задач.
     """
     tg_id = message.from_user.id
-    api = BackendAPI()
     try:
         page = 1
         resp = await api.list_tasks(tg_id=tg_id, page=page)
         items = resp.get("results", [])
         if not items:
-            await message.answer("Пока пусто. Нажми «Добавить задачу».")
-            await message.answer("Для добавления задачи воспользуйся командой /add.")
+            await message.answer(
+                "Пока пусто. Нажми «Добавить задачу».\n"
+                "Для добавления задачи воспользуйся командой /add."
+            )
             return
-        lines = [fmt_task_line(t) for t in items[:10]]
-        await message.answer("\n".join(lines))
-        await message.answer("Для добавления задачи воспользуйся командой /add.")
-        await message.answer("Для редактирования задачи воспользуйся командой /edittask.")
-        await message.answer("Для редактирования статуса задачи воспользуйся командой /status.")
-        await message.answer("Для удаления задачи воспользуйся командой /deltask.")
+        await message.answer("\n".join(map(fmt_task_line, islice(items, TASKS_PREVIEW_LIMIT))))
+        await message.answer(TASKS_COMMANDS_HINT)
     except Exception as e:
         await message.answer(f"Ошибка запроса задач: {e}")
-    finally:
-        await api.aclose()
 
 
-@router.message(F.text == "Мои категории")
-async def list_categories(message: Message):
+async def list_categories(message: Message, api: BackendAPI):
     """
     Обрабатывает запрос на список категорий пользователя.
 
@@ -54,13 +60,13 @@ async def list_categories(message: Message):
 
     Args:
         message (Message): Сообщение от пользователя в чате.
+        api (BackendAPI): Общий клиент бэкенда.
 
     Raises:
         Exception: Исключение может быть вызвано при ошибках запроса или
             выполнения API-операций.
     """
     tg_id = message.from_user.id
-    api = BackendAPI()
     try:
         cats = await api.list_categories(tg_id=tg_id)
         if not cats:
@@ -73,82 +79,40 @@ async def list_categories(message: Message):
         await message.answer("Для удаления категории воспользуйся командой /delcat.")
     except Exception as e:
         await message.answer(f"Ошибка запроса категорий: {e}")
-    finally:
-        await api.aclose()
-
-
-@router.message(F.text == "Добавить задачу")
-async def add_task_hint(message: Message) -> None:
-    """
-    Обрабатывает сообщение для подсказки добавления задачи.
-
-    Args:
-        message (Message): Входящее сообщение от пользователя.
-    """
-    await message.answer("Введи /add чтобы создать задачу.")
 
 
-@router.message(F.text == "Редактировать задачу")
-async def edit_task_hint(message: Message) -> None:
-    """
-    Обрабатывает сообщение с текстом "Редактировать задачу".
+# Подсказки для текстовых кнопок с командами.
+HINTS: dict[str, str] = {
+    "Добавить задачу": "Введи /add чтобы создать задачу.",
+    "Редактировать задачу": "Введи /edittask чтобы изменить существующую задачу.",
+    "Редактировать статус": "Введи /status чтобы изменить статус задачи.",
+    "Удалить задачу": "Введи /deltask чтобы удалить задачу.",
+    "Добавить категорию": "Введи /addcat чтобы создать категорию.",
+    "Редактировать категорию": "Введи /editcat чтобы изменить существующую категорию.",
+    "Удалить категорию": "Введи /delcat чтобы удалить категорию.",
+}
 
-    Args:
-        message (Message): Сообщение от пользователя.
-    """
-    await message.answer("Введи /edittask чтобы изменить существующую задачу.")
 
+# Кнопки, которые запрашивают данные у бэкенда.
+BUTTONS: dict[str, Callable[[Message, BackendAPI], Awaitable[None]]] = {
+    "Мои задачи": list_tasks,
+    "Мои категории": list_categories,
+}
+# Все тексты, на которые отвечает роутер: один фильтр с поиском по хэшу вместо цепочки сравнений.
+TRIGGERS: frozenset[str] = frozenset(BUTTONS) | frozenset(HINTS)
 
-@router.message(F.text == "Редактировать статус")
-async def edit_task_hint(message: Message) -> None:
-    """
-    Обрабатывает команду "Редактировать статус" для изменения статуса задачи.
 
-    Args:
-        message (Message): Объект сообщения, содержащее текст команды.
+@router.message(F.text.func(TRIGGERS.__contains__))
+async def on_text_button(message: Message, api: BackendAPI) -> None:
     """
-    await message.answer("Введи /status чтобы изменить статус задачи.")
-
-
-@router.message(F.text == "Удалить задачу")
-async def delete_task_hint(message: Message) -> None:
-    """
-    Обрабатывает сообщение с текстом "Удалить задачу" и предоставляет подсказку.
+    Направляет нажатие текстовой кнопки в её обработчик или отвечает подсказкой.
 
     Args:
         message (Message): Входящее сообщение от пользователя.
+        api (BackendAPI): Общий клиент бэкенда.
     """
-    await message.answer("Введи /deltask чтобы удалить задачу.")
-
-
-@router.message(F.text == "Добавить категорию")
-async def add_category_hint(message: Message) -> None:
-    """
-    Отправляет пользователю подсказку для добавления новой категории.
-
-    Args:
-        message (Message): Сообщение от пользователя.
-    """
-    await message.answer("Введи /addcat чтобы создать категорию.")
-
-
-@router.message(F.text == "Редактировать категорию")
-async def edit_category_hint(message: Message) -> None:
-    """
-    Обрабатывает сообщение для изменения категории.
-
-    Args:
-        message (Message): Сообщение от пользователя.
-    """
-    await message.answer("Введи /editcat чтобы изменить существующую категорию.")
-
-
-@router.message(F.text == "Удалить задачу")
-async def delete_category_hint(message: Message) -> None:
-    """
-    Обрабатывает сообщение для удаления задачи.
-
-    Args:
-        message (Message): Объект сообщения, полученного от пользователя.
-    """
-    await message.answer("Введи /delcat чтобы удалить задачу.")
+    handler = BUTTONS.get(message.text)
+    if handler is not None:
+        await handler(message, api)
+        return
+    await message.answer(HINTS[message.text])
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
 import uvloop
@@ -13,20 +12,22 @@ from aiogram_dialog import setup_dialogs, DialogManager, StartMode
 from aiohttp import web
 
 from core.config import settings
-from dialogs.add_category import add_category_dialog, AddCategorySG
-from dialogs.category_delete import DeleteCategorySG, delete_category_dialog
-from dialogs.category_edit import EditCategorySG, edit_category_dialog
+from dialogs import DIALOGS
+from dialogs.add_category import AddCategorySG
+from dialogs.category_delete import DeleteCategorySG
+from dialogs.category_edit import EditCategorySG
 from dialogs.start import router as start_router
-from dialogs.task_add import add_task_dialog, AddTaskSG
-from dialogs.task_delete import DeleteTaskSG, delete_task_dialog
-from dialogs.task_edit import edit_task_dialog, EditTaskSG
-from dialogs.task_status import change_task_status_dialog, ChangeTaskStatusSG
+from dialogs.task_add import AddTaskSG
+from dialogs.task_delete import DeleteTaskSG
+from dialogs.task_edit import EditTaskSG
+from dialogs.task_status import ChangeTaskStatusSG
 from handlers.tasks_list import router as tasks_router
 from middlewares.rate_limit import RateLimitMiddleware
+from services.api import BackendAPI
 from web.health import make_app
 
 
-async def run_health_server():
+async def run_health_server() -> web.AppRunner:
     """
     Создает и запускает сервер проверки состояния (health server).
 
@@ -34,7 +35,7 @@ async def run_health_server():
         Нет аргументов.
 
     Returns:
-        None: Функция не возвращает значения.
+        web.AppRunner: Запущенный раннер; его нужно освободить через `cleanup()`.
 
     Raises:
         OSError: Если возникают ошибки при настройке или запуске сервера.
@@ -44,6 +45,7 @@ async def run_health_server():
     await runner.setup()
     site = web.TCPSite(runner, host="0.0.0.0", port=settings.health_port)
     await site.start()
+    return runner
 
 
 async def main():
@@ -57,29 +59,21 @@ async def main():
         Exception: Любая ошибка, возникающая во время работы основного цикла или настройки.
     """
     bot = Bot(token=settings.bot_token)
-    dp = Dispatcher()
+    # Один клиент бэкенда на весь процесс: пул соединений переиспользуется между апдейтами.
+    api = BackendAPI()
+    dp = Dispatcher(api=api)
+    dp.shutdown.register(api.aclose)
 
     # middleware
     dp.message.middleware(RateLimitMiddleware(limit=5, per_seconds=10))
     dp.callback_query.middleware(RateLimitMiddleware(limit=10, per_seconds=10))
 
     # routers
-    dp.include_router(start_router)
-    dp.include_router(tasks_router)
-    dp.include_router(add_task_dialog)
-    dp.include_router(edit_task_dialog)
-    dp.include_router(delete_task_dialog)
-    dp.include_router(change_task_status_dialog)
-    dp.include_router(add_category_dialog)
-    dp.include_router(edit_category_dialog)
-    dp.include_router(delete_category_dialog)
+    dp.include_routers(start_router, tasks_router, *DIALOGS)
 
     # инициализация диалогов (v2)
     setup_dialogs(dp)
 
-    # background health http server
-    asyncio.create_task(run_health_server())
-
     # команда для запуска мастера добавления задачи
     @dp.message(Command("add"))
     async def start_add_dialog(message: Message, dialog_manager: DialogManager):
@@ -93,14 +87,19 @@ async def main():
         await dialog_manager.start(AddTaskSG.title, mode=StartMode.RESET_STACK)
 
     @dp.message(Command("edittask"))
-    async def start_edit_dialog(message: Message, dialog_manager: DialogManager):
+    async def start_edit_dialog(message: Message, dialog_manager: DialogManager, api: BackendAPI):
         """
         Запускает диалог редактирования задачи.
 
+        Категории понадобятся на шаге выбора категорий, поэтому их запрос
+        запускается сразу и идёт параллельно с загрузкой списка задач.
+
         Args:
             message (Message): Сообщение от пользователя.
             dialog_manager (DialogManager): Менеджер управления диалогом.
+            api (BackendAPI): Общий клиент бэкенда.
         """
+        api.prefetch_categories(tg_id=message.from_user.id)
         await dialog_manager.start(EditTaskSG.choose_task, mode=StartMode.RESET_STACK)
 
     @dp.message(Command("status"))
@@ -140,38 +139,46 @@ async def main():
         await dialog_manager.start(AddCategorySG.name, mode=StartMode.RESET_STACK)
 
     @dp.message(Command("editcat"))
-    async def start_edit_category(message: Message, dialog_manager: DialogManager):
+    async def start_edit_category(message: Message, dialog_manager: DialogManager, api: BackendAPI):
         """
         Начинает процесс редактирования категории.
 
         Args:
             message (Message): Сообщение от пользователя.
             dialog_manager (DialogManager): Менеджер диалога.
+            api (BackendAPI): Общий клиент бэкенда.
         """
+        api.prefetch_categories(tg_id=message.from_user.id)
         await dialog_manager.start(
             EditCategorySG.choose_category, mode=StartMode.RESET_STACK
         )
 
     @dp.message(Command("delcat"))
-    async def start_delete_category(message: Message, dialog_manager: DialogManager) -> None:
+    async def start_delete_category(message: Message, dialog_manager: DialogManager, api: BackendAPI) -> None:
         """
         Запускает диалог удаления категории.
 
         Args:
             message (Message): Объект сообщения, инициировавшего команду.
             dialog_manager (DialogManager): Менеджер диалогов.
+            api (BackendAPI): Общий клиент бэкенда.
         """
+        api.prefetch_categories(tg_id=message.from_user.id)
         await dialog_manager.start(
             DeleteCategorySG.choose_category, mode=StartMode.RESET_STACK
         )
 
-    await dp.start_polling(bot)
+    # health-сервер поднимается до опроса: ошибка привязки порта сразу остановит запуск
+    health_runner = await run_health_server()
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await health_runner.cleanup()
 
 
 if __name__ == "__main__":
-    uvloop.install()
     logging.basicConfig(level=logging.INFO)
     try:
-        asyncio.run(main())
+        uvloop.run(main())
     except (KeyboardInterrupt, SystemExit):
         pass
@@ -3,11 +3,10 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict, deque
-from typing import Deque
+from collections import OrderedDict
 
 from aiogram import BaseMiddleware
-from aiogram.types import TelegramObject, Message, CallbackQuery
+from aiogram.types import TelegramObject
 
 
 class RateLimitMiddleware(BaseMiddleware):
@@ -22,20 +21,31 @@ class RateLimitMiddleware(BaseMiddleware):
         limit (int): Максимальное количество запросов за указанный интервал времени.
         per (int): Интервал времени в секундах, на протяжении которого
             действует ограничение.
+
+    Число событий считается скользящим окном по двум счётчикам: события текущего
+    окна плюс доля событий предыдущего, пропорциональная его перекрытию с
+    последними `per` секундами. Это O(1) на событие и без хранения временных меток.
+
+    Счётчики хранятся в порядке последнего обращения: записи, окна которых уже
+    ничего не дают в оценку, удаляются с начала, а число пользователей ограничено
+    `max_users`.
     """
 
-    def __init__(self, limit: int = 5, per_seconds: int = 10):
+    def __init__(self, limit: int = 5, per_seconds: int = 10, max_users: int = 50_000):
         """
         Инициализирует объект с заданными ограничениями на количество вызовов.
 
         Args:
             limit (int): Максимальное количество вызовов за указанный период.
             per_seconds (int): Период времени в секундах, за который действует ограничение.
+            max_users (int): Сколько пользователей отслеживать одновременно; самые давние вытесняются.
         """
         super().__init__()
         self.limit = limit
         self.per = per_seconds
-        self._hits: dict[int, Deque[float]] = defaultdict(lambda: deque(maxlen=100))
+        self.max_users = max_users
+        # user_id -> (начало текущего окна, событий в нём, событий в предыдущем окне)
+        self._hits: OrderedDict[int, tuple[float, int, int]] = OrderedDict()
 
     async def __call__(self, handler, event: TelegramObject, data: dict):
         """
@@ -47,25 +57,46 @@ class RateLimitMiddleware(BaseMiddleware):
             data (dict): Дополнительные данные, переданные обработчику.
 
         Returns:
-            Any: Результат выполнения переданного обработчика.
+            Any: Результат выполнения переданного обработчика или None, если событие
+            отклонено из-за превышения лимита.
 
         Raises:
             Exception: В случае если переданный обработчик или объект события вызовет ошибку.
         """
-        user_id = None
-        if isinstance(event, Message):
-            user_id = event.from_user.id if event.from_user else None
-        elif isinstance(event, CallbackQuery):
-            user_id = event.from_user.id if event.from_user else None
+        # Middleware вешается на Message и CallbackQuery: у обоих есть from_user и answer().
+        user = getattr(event, "from_user", None)
+        user_id = user.id if user else None
         if user_id:
-            now = time.time()
-            dq = self._hits[user_id]
-            while dq and now - dq[0] > self.per:
-                dq.popleft()
-            if len(dq) >= self.limit:
-                if isinstance(event, Message):
-                    await event.answer("Слишком часто. Попробуй чуть позже.")
-                elif isinstance(event, CallbackQuery):
-                    await event.answer("Слишком часто. Попробуй чуть позже.", show_alert=False)
-            dq.append(now)
+            now = time.monotonic()
+            window_start, count, prev_count = self._hits.get(user_id, (now, 0, 0))
+            elapsed = now - window_start
+            if elapsed >= self.per:
+                prev_count = count if elapsed < 2 * self.per else 0
+                window_start = now - elapsed % self.per
+                count = 0
+            estimated = prev_count * (1 - (now - window_start) / self.per) + count
+            if estimated >= self.limit:
+                answer = getattr(event, "answer", None)
+                if answer is not None:
+                    await answer("Слишком часто. Попробуй чуть позже.")
+                # Отклонённое событие не считается, иначе окно не освободится, пока пользователь шлёт запросы.
+                return None
+            self._hits[user_id] = (window_start, count + 1, prev_count)
+            self._hits.move_to_end(user_id)
+            self._evict(now)
         return await handler(event, data)
+
+    def _evict(self, now: float) -> None:
+        """
+        Удаляет устаревшие счётчики и вытесняет самые давние сверх `max_users`.
+
+        Args:
+            now (float): Текущее значение `time.monotonic()`.
+        """
+        hits = self._hits
+        stale_before = now - 2 * self.per
+        while hits:
+            user_id, (window_start, _, _) = next(iter(hits.items()))
+            if window_start > stale_before and len(hits) <= self.max_users:
+                break
+            del hits[user_id]
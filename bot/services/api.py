@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+from typing import Any, Final
 
 import httpx
+import orjson
 from httpx import Response
 
 from core.config import settings
-from core.jwt import build_bot_jwt
+from core.jwt import get_bot_auth_header
+from services.cache import TTLCache
+
+READ_MAX_CONNECTIONS: Final[int] = 32
+WRITE_MAX_CONNECTIONS: Final[int] = 8
+KEEPALIVE_EXPIRY_SECONDS: Final[float] = 60.0
+CONNECT_TIMEOUT_SECONDS: Final[float] = 2.0
+# Категории меняются только через этот же клиент, который сбрасывает кэш при записи.
+CATEGORIES_TTL_SECONDS: Final[float] = 60.0
+# Страницы задач живут недолго: окна диалогов перерисовываются часто, а статусы
+# задач может менять и сам бэкенд.
+TASKS_TTL_SECONDS: Final[float] = 10.0
 
 
 class BackendAPI:
@@ -19,31 +31,77 @@ class BackendAPI:
     Предоставляет методы для выполнения различных операций, таких как регистрация,
     работа с категориями и задачами.
 
+    Чтения (GET) и записи идут через разные пулы соединений, чтобы всплеск
+    запросов от геттеров диалогов не вытеснял редкие изменяющие запросы.
+
     Атрибуты:
-        _client (httpx.AsyncClient): HTTP клиент для выполнения запросов.
+        _read_client (httpx.AsyncClient): HTTP клиент для GET-запросов.
+        _write_client (httpx.AsyncClient): HTTP клиент для изменяющих запросов.
         _retries (int): Количество попыток повторных запросов в случае ошибок.
+        _categories_cache (TTLCache[int, list[dict[str, Any]]]): Категории по tg_id.
+        _tasks_cache (TTLCache[tuple[int, int], dict[str, Any]]): Страницы задач по (tg_id, page).
     """
 
     def __init__(self) -> None:
         """
         Инициализирует экземпляр класса.
 
-        Создает асинхронный HTTP-клиент с указанной базовой URL, тайм-аутом и заголовками.
+        Создает асинхронные HTTP-клиенты для чтения и записи с указанной базовой URL,
+        тайм-аутом и заголовками.
+        """
+        self._read_client = self._make_client(READ_MAX_CONNECTIONS)
+        self._write_client = self._make_client(WRITE_MAX_CONNECTIONS)
+        self._retries = settings.http_retries
+        self._categories_cache: TTLCache[int, list[dict[str, Any]]] = TTLCache(CATEGORIES_TTL_SECONDS)
+        self._tasks_cache: TTLCache[tuple[int, int], dict[str, Any]] = TTLCache(TASKS_TTL_SECONDS)
+
+    @staticmethod
+    def _make_client(max_connections: int) -> httpx.AsyncClient:
+        """
+        Создает HTTP-клиент бэкенда с заданным размером пула соединений.
+
+        Простаивающие соединения живут `KEEPALIVE_EXPIRY_SECONDS`, а установка
+        соединения ограничена `CONNECT_TIMEOUT_SECONDS`, чтобы недоступный бэкенд
+        быстрее уходил в повторную попытку.
+
+        Args:
+            max_connections (int): Максимальное число соединений в пуле.
+
+        Returns:
+            httpx.AsyncClient: Настроенный HTTP-клиент.
         """
-        self._client = httpx.AsyncClient(
+        return httpx.AsyncClient(
             base_url=settings.backend_base_url.rstrip("/"),
-            timeout=settings.http_timeout,
+            timeout=httpx.Timeout(
+                settings.http_timeout,
+                connect=min(settings.http_timeout, CONNECT_TIMEOUT_SECONDS),
+            ),
             headers={"Content-Type": "application/json"},
+            # Все соединения пула остаются открытыми между запросами: бот обращается к
+            # одному хосту, и повторное рукопожатие дороже простаивающего сокета.
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=settings.http2,
         )
-        self._retries = settings.http_retries
 
     async def aclose(self) -> None:
         """
-        Закрывает клиентское соединение асинхронно.
+        Закрывает клиентские соединения асинхронно.
         """
-        await self._client.aclose()
-
-    async def _request(self, method: str, path: str, *, tg_id: int | None, json: Any | None = None) -> httpx.Response:
+        await asyncio.gather(self._read_client.aclose(), self._write_client.aclose())
+
+    async def _request(
+            self,
+            method: str,
+            path: str,
+            *,
+            tg_id: int | None,
+            json: Any | None = None,
+            params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
         """
         Выполняет HTTP-запрос к серверу с поддержкой механизма повторных попыток.
 
@@ -52,6 +110,7 @@ class BackendAPI:
             path (str): Путь запроса к серверу.
             tg_id (int | None): ID пользователя Telegram, если применимо.
             json (Any | None): Тело JSON-запроса, если требуется.
+            params (dict[str, Any] | None): Параметры строки запроса; httpx кодирует их сам.
 
         Returns:
             httpx.Response: Ответ сервера.
@@ -61,14 +120,16 @@ class BackendAPI:
             httpx.ReadTimeout: Тайм-аут чтения ответа от сервера.
             httpx.WriteError: Ошибка записи запроса на сервер.
         """
-        url = f"{path}"
+        client = self._read_client if method == "GET" else self._write_client
+        content = orjson.dumps(json) if json is not None else None
+        # Токен живёт дольше всех повторных попыток, поэтому заголовки собираются один раз.
+        headers = {"Authorization": get_bot_auth_header()}
+        if tg_id is not None and not path.startswith("/bot/"):
+            headers["X-Act-As-User"] = str(tg_id)
         last_exc: Exception | None = None
         for attempt in range(1, self._retries + 2):
             try:
-                headers = {"Authorization": f"Bearer {build_bot_jwt()}"}
-                if tg_id is not None and not path.startswith("/bot/"):
-                    headers["X-Act-As-User"] = str(tg_id)
-                resp = await self._client.request(method, url, headers=headers, json=json)
+                resp = await client.request(method, path, headers=headers, content=content, params=params)
                 if resp.status_code >= 500 and attempt <= self._retries:
                     await asyncio.sleep(0.2 * attempt)
                     continue
@@ -104,12 +165,15 @@ class BackendAPI:
         resp = await self._request("POST", "/bot/register/", tg_id=None, json={"tg_id": tg_id, "username": username})
         if resp.status_code not in (200, 201):
             raise BackendError(f"register failed: {resp.status_code} {safe_text(resp)}")
-        return resp.json()
+        return _decode(resp)
 
     async def list_categories(self, *, tg_id: int) -> list[dict[str, Any]]:
         """
         Возвращает список категорий.
 
+        Ответ кэшируется на `CATEGORIES_TTL_SECONDS`; создание, изменение и удаление
+        категорий через этот клиент сбрасывают кэш пользователя.
+
         Args:
             tg_id (int): Идентификатор Telegram-пользователя.
 
@@ -120,9 +184,32 @@ class BackendAPI:
         Raises:
             HTTPException: В случае, если запрос завершился с ошибкой.
         """
+        return await self._categories_cache.get_or_set(tg_id, lambda: self._fetch_categories(tg_id))
+
+    def prefetch_categories(self, *, tg_id: int) -> None:
+        """
+        Запускает загрузку категорий в фоне, чтобы следующий `list_categories` её дождался.
+
+        Args:
+            tg_id (int): Идентификатор Telegram-пользователя.
+        """
+        self._categories_cache.prefetch(tg_id, lambda: self._fetch_categories(tg_id))
+
+    async def _fetch_categories(self, tg_id: int) -> list[dict[str, Any]]:
+        """
+        Запрашивает список категорий у бэкенда в обход кэша.
+
+        Args:
+            tg_id (int): Идентификатор Telegram-пользователя.
+
+        Returns:
+            list[dict[str, Any]]: Список категорий.
+        """
         resp = await self._request("GET", "/categories/", tg_id=tg_id)
         _raise_for_client(resp)
-        return resp.json().get("results", resp.json())
+        data = _decode(resp)
+        # Без пагинации DRF отдаёт голый список, а с ней — словарь с ключом "results".
+        return data.get("results", data) if isinstance(data, dict) else data
 
     async def create_category(self, *, tg_id: int, name: str) -> dict[str, Any]:
         """
@@ -139,8 +226,9 @@ class BackendAPI:
             ClientError: Возникает при некорректном ответе клиента.
         """
         resp = await self._request("POST", "/categories/", tg_id=tg_id, json={"name": name})
+        self._categories_cache.pop(tg_id)
         _raise_for_client(resp)
-        return resp.json()
+        return _decode(resp)
 
     async def patch_category(self, *, tg_id: int, category_id: str, name: str) -> dict[str, Any]:
         """
@@ -164,8 +252,9 @@ class BackendAPI:
             tg_id=tg_id,
             json=payload,
         )
+        self._categories_cache.pop(tg_id)
         _raise_for_client(resp)
-        return resp.json()
+        return _decode(resp)
 
     async def delete_category(self, *, tg_id: int, category_id: str) -> None:
         """
@@ -179,6 +268,7 @@ class BackendAPI:
             HTTPException: Возникает, если запрос завершился ошибкой.
         """
         resp = await self._request("DELETE", f"/categories/{category_id}/", tg_id=tg_id)
+        self._categories_cache.pop(tg_id)
         _raise_for_client(resp)
         return None
 
@@ -199,19 +289,44 @@ class BackendAPI:
         Raises:
             Исключение клиента: Возникает в случае, если запрос не был выполнен успешно.
         """
-        params = []
+        params: dict[str, Any] = {}
         if page and page > 1:
-            params.append(f"page={page}")
+            params["page"] = page
         if status:
-            params.append(f"status={status}")
+            params["status"] = status
         if category:
-            params.append(f"category={category}")
-        path = "/tasks/"
-        if params:
-            path += "?" + "&".join(params)
-        resp = await self._request("GET", path, tg_id=tg_id)
+            params["category"] = category
+        resp = await self._request("GET", "/tasks/", tg_id=tg_id, params=params or None)
         _raise_for_client(resp)
-        return resp.json()
+        return _decode(resp)
+
+    async def list_tasks_page(self, *, tg_id: int, page: int = 1) -> dict[str, Any]:
+        """
+        Возвращает страницу задач без фильтров, повторно используя недавний ответ.
+
+        Ответ кэшируется на `TASKS_TTL_SECONDS`; создание, изменение и удаление задач
+        через этот клиент и `invalidate_tasks` сбрасывают все страницы пользователя.
+
+        Args:
+            tg_id (int): Уникальный идентификатор пользователя.
+            page (int): Номер страницы (по умолчанию 1).
+
+        Returns:
+            dict[str, Any]: Объект JSON с данными о задачах.
+
+        Raises:
+            BackendError: Если бэкенд вернул ошибку.
+        """
+        return await self._tasks_cache.get_or_set((tg_id, page), lambda: self.list_tasks(tg_id=tg_id, page=page))
+
+    def invalidate_tasks(self, *, tg_id: int) -> None:
+        """
+        Сбрасывает закэшированные страницы задач пользователя.
+
+        Args:
+            tg_id (int): Уникальный идентификатор пользователя.
+        """
+        self._tasks_cache.pop_matching(lambda key: key[0] == tg_id)
 
     async def create_task(self, *, tg_id: int, title: str, description: str = "", due_at_iso: str | None = None,
                           categories: list[str] | None = None) -> dict[str, Any]:
@@ -238,8 +353,9 @@ class BackendAPI:
         if categories:
             payload["categories"] = categories
         resp = await self._request("POST", "/tasks/", tg_id=tg_id, json=payload)
+        self.invalidate_tasks(tg_id=tg_id)
         _raise_for_client(resp)
-        return resp.json()
+        return _decode(resp)
 
     async def patch_task(self, *, tg_id: int, task_id: str, **fields: Any) -> dict[str, Any]:
         """
@@ -257,8 +373,9 @@ class BackendAPI:
             Исключение клиента: Если сервер возвращает ошибку.
         """
         resp = await self._request("PATCH", f"/tasks/{task_id}/", tg_id=tg_id, json=fields)
+        self.invalidate_tasks(tg_id=tg_id)
         _raise_for_client(resp)
-        return resp.json()
+        return _decode(resp)
 
     async def delete_task(self, *, tg_id: int, task_id: str) -> None:
         """
@@ -275,6 +392,7 @@ class BackendAPI:
             Исключение: Если сервер вернул ошибку в ответе.
         """
         resp = await self._request("DELETE", f"/tasks/{task_id}/", tg_id=tg_id)
+        self.invalidate_tasks(tg_id=tg_id)
         _raise_for_client(resp)
         return None
 
@@ -285,8 +403,32 @@ class BackendError(RuntimeError):
 
     Используется для идентификации ошибок, происходящих в процессе работы
     с бэкендом. Наследуется от RuntimeError.
+
+    Attributes:
+        status (int | None): HTTP-статус ответа бэкенда.
+        data (Any): Разобранное JSON-тело ответа или None, если тело не JSON.
     """
-    pass
+
+    def __init__(self, message: str, *, status: int | None = None, data: Any = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.data = data
+
+
+def _decode(resp: httpx.Response) -> Any:
+    """
+    Разбирает JSON-тело ответа бэкенда.
+
+    Args:
+        resp (httpx.Response): HTTP-ответ бэкенда.
+
+    Returns:
+        Any: Разобранное тело ответа.
+
+    Raises:
+        orjson.JSONDecodeError: Если тело ответа не является JSON (подкласс ValueError).
+    """
+    return orjson.loads(resp.content)
 
 
 def _raise_for_client(resp: httpx.Response) -> None:
@@ -301,8 +443,29 @@ def _raise_for_client(resp: httpx.Response) -> None:
     """
     if 200 <= resp.status_code < 300:
         return
-    text = safe_text(resp)
-    raise BackendError(f"{resp.status_code}: {text}")
+    try:
+        data = _decode(resp)
+    except ValueError:
+        data = None
+    raise BackendError(f"{resp.status_code}: {_error_text(resp, data)}", status=resp.status_code, data=data)
+
+
+def _error_text(resp: httpx.Response, data: Any) -> str:
+    """
+    Формирует текст ошибки из уже разобранного тела ответа.
+
+    Args:
+        resp (httpx.Response): Объект ответа HTTP.
+        data (Any): Разобранное JSON-тело ответа или None.
+
+    Returns:
+        str: Текст ошибки.
+    """
+    if data is None:
+        return resp.text[:200]
+    if isinstance(data, dict) and "detail" in data:
+        return str(data["detail"])
+    return str(data)
 
 
 def safe_text(resp: httpx.Response) -> str:
@@ -320,7 +483,7 @@ def safe_text(resp: httpx.Response) -> str:
         str: Извлеченный текст из ответа.
     """
     try:
-        data = resp.json()
+        data = _decode(resp)
         if isinstance(data, dict) and "detail" in data:
             return str(data["detail"])
         return str(data)
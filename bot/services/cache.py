@@ -0,0 +1,177 @@
+"""Небольшой кэш ответов бэкенда в памяти процесса."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Кэш значений с ограниченным временем жизни (cache-aside).
+
+    Одновременные промахи по одному ключу ждут одну общую задачу загрузки вместо
+    того, чтобы каждый раз обращаться к бэкенду. Если ключ сбросили во время
+    загрузки, её результат не сохраняется, чтобы не вернуть данные до изменения;
+    загрузки по другим ключам при этом не затрагиваются.
+
+    Attributes:
+        ttl (float): Время жизни значения в секундах.
+        max_size (int): Размер, после которого при записи удаляются истёкшие значения.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10_000) -> None:
+        """
+        Инициализирует пустой кэш.
+
+        Args:
+            ttl (float): Время жизни значения в секундах.
+            max_size (int): Размер, после которого при записи удаляются истёкшие значения.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: dict[K, tuple[float, V]] = {}
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    def _get_fresh(self, key: K) -> tuple[bool, V | None]:
+        """
+        Возвращает значение по ключу, если оно ещё не истекло.
+
+        Args:
+            key (K): Ключ кэша.
+
+        Returns:
+            tuple[bool, V | None]: Признак попадания и значение.
+        """
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    async def get_or_set(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Возвращает значение из кэша или загружает и сохраняет его.
+
+        Args:
+            key (K): Ключ кэша.
+            loader (Callable[[], Awaitable[V]]): Загрузчик значения при промахе.
+
+        Returns:
+            V: Закэшированное или только что загруженное значение.
+
+        Raises:
+            Exception: Любая ошибка загрузчика; она не кэшируется.
+        """
+        hit, value = self._get_fresh(key)
+        if hit:
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_load(key, loader)
+        # shield: отмена одного из ожидающих не должна прерывать общую загрузку.
+        return await asyncio.shield(task)
+
+    def prefetch(self, key: K, loader: Callable[[], Awaitable[V]]) -> None:
+        """
+        Запускает загрузку значения в фоне, если его нет в кэше и оно ещё не загружается.
+
+        Следующий `get_or_set` по этому ключу дождётся уже идущей загрузки. Ошибка
+        фоновой загрузки не кэшируется: следующий `get_or_set` повторит запрос.
+
+        Args:
+            key (K): Ключ кэша.
+            loader (Callable[[], Awaitable[V]]): Загрузчик значения.
+        """
+        hit, _ = self._get_fresh(key)
+        if not hit and key not in self._inflight:
+            self._start_load(key, loader)
+
+    def _start_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> asyncio.Task[V]:
+        """
+        Создаёт общую задачу загрузки и регистрирует её как выполняющуюся для ключа.
+
+        Args:
+            key (K): Ключ кэша.
+            loader (Callable[[], Awaitable[V]]): Загрузчик значения.
+
+        Returns:
+            asyncio.Task[V]: Задача загрузки.
+        """
+        task = asyncio.ensure_future(self._load(key, loader))
+        # Ошибку получают ожидающие; если их не осталось, она не должна попасть в лог
+        # как «Task exception was never retrieved».
+        task.add_done_callback(_consume_exception)
+        self._inflight[key] = task
+        return task
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Загружает значение и сохраняет его, если ключ не сбросили во время загрузки.
+
+        Args:
+            key (K): Ключ кэша.
+            loader (Callable[[], Awaitable[V]]): Загрузчик значения.
+
+        Returns:
+            V: Загруженное значение.
+        """
+        task = asyncio.current_task()
+        try:
+            value = await loader()
+        finally:
+            # pop() убирает задачу из _inflight, и тогда результат уже устарел.
+            owner = self._inflight.get(key) is task
+            if owner:
+                del self._inflight[key]
+        if owner:
+            self._store(key, value)
+        return value
+
+    def _store(self, key: K, value: V) -> None:
+        """
+        Сохраняет значение и при переполнении удаляет истёкшие записи.
+
+        Args:
+            key (K): Ключ кэша.
+            value (V): Значение.
+        """
+        now = time.monotonic()
+        if len(self._data) >= self.max_size:
+            self._data = {k: entry for k, entry in self._data.items() if entry[0] > now}
+        self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: K) -> None:
+        """
+        Сбрасывает значение по ключу, в том числе загружаемое прямо сейчас.
+
+        Args:
+            key (K): Ключ кэша.
+        """
+        self._data.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def pop_matching(self, predicate: Callable[[K], bool]) -> None:
+        """
+        Сбрасывает все значения, ключи которых удовлетворяют условию.
+
+        Args:
+            predicate (Callable[[K], bool]): Условие отбора ключей.
+        """
+        for key in [k for k in (*self._data, *self._inflight) if predicate(k)]:
+            self.pop(key)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """
+    Помечает исключение завершённой задачи как полученное.
+
+    Args:
+        task (asyncio.Task): Завершённая задача.
+    """
+    if not task.cancelled():
+        task.exception()
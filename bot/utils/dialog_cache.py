@@ -0,0 +1,159 @@
+"""Кэширование ответов бэкенда для геттеров окон диалогов."""
+
+from __future__ import annotations
+
+from typing import Any, Final, NamedTuple
+
+from aiogram_dialog import DialogManager
+
+from services.api import BackendAPI, BackendError
+
+_TASKS_PAGE_KEY: Final[str] = "_tasks_page"
+_TASKS_HAS_NEXT_KEY: Final[str] = "_tasks_has_next"
+
+
+class SelectItem(NamedTuple):
+    """
+    Элемент виджета Select.
+
+    Элементы строятся в геттере окна и не сохраняются в `dialog_data`: там лежат
+    только простые данные (словари, строки), которые переживут любое хранилище FSM.
+
+    Attributes:
+        id (str): Идентификатор, который Select передаёт в обработчик.
+        label (str): Подпись кнопки.
+    """
+    id: str
+    label: str
+
+
+def build_category_choices(categories: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Строит элементы выбора категорий и индекс для поиска выбранной категории.
+
+    Args:
+        categories (list[dict[str, Any]]): Категории из API.
+
+    Returns:
+        dict[str, Any]: Словарь с ключами "items" (элементы для Select) и "index"
+        (категории по id и slug).
+    """
+    items: list[SelectItem] = []
+    index: dict[str, dict[str, Any]] = {}
+    for category in categories:
+        identifier = category.get("id") or category.get("slug")
+        name = category.get("name", "Без названия")
+        if identifier is None:
+            continue
+        items.append(SelectItem(str(identifier), name))
+        # Выбранную категорию ищут и по id, и по slug.
+        index[str(category.get("id"))] = category
+        if category.get("slug"):
+            index.setdefault(str(category["slug"]), category)
+    return {"items": items, "index": index}
+
+
+# Подпись задачи в списках выбора: «#<id> — <название>».
+format_task_label = "#{} — {}".format
+# Строка задачи в текстовом списке окна: «#<id>: <название>».
+format_task_line = "#{}: {}".format
+
+
+def build_category_names(categories: list[dict[str, Any]]) -> dict[str, str]:
+    """
+    Сопоставляет id категорий с их названиями с сохранением порядка из API.
+
+    Args:
+        categories (list[dict[str, Any]]): Категории из API.
+
+    Returns:
+        dict[str, str]: Названия категорий по id.
+    """
+    return {str(c["id"]): c["name"] for c in categories}
+
+
+async def get_tasks_cached(manager: DialogManager, api: BackendAPI) -> list[dict[str, Any]]:
+    """
+    Возвращает текущую страницу задач пользователя, повторно используя недавний ответ.
+
+    Сами страницы кэширует `BackendAPI.list_tasks_page`, а в `dialog_data` хранятся
+    только номер страницы (меняется через `change_tasks_page`) и признак следующей
+    страницы. Если страница перестала существовать (например, задачи удалили),
+    возвращается первая.
+
+    Args:
+        manager (DialogManager): Менеджер текущего диалога.
+        api (BackendAPI): Клиент бэкенда.
+
+    Returns:
+        list[dict[str, Any]]: Задачи текущей страницы.
+
+    Raises:
+        BackendError: Если бэкенд вернул ошибку.
+    """
+    page: int = manager.dialog_data.get(_TASKS_PAGE_KEY, 1)
+    tg_id = manager.event.from_user.id
+    try:
+        response = await api.list_tasks_page(tg_id=tg_id, page=page)
+    except BackendError as exc:
+        if exc.status != 404 or page == 1:
+            raise
+        page = 1
+        manager.dialog_data[_TASKS_PAGE_KEY] = page
+        response = await api.list_tasks_page(tg_id=tg_id, page=page)
+    manager.dialog_data[_TASKS_HAS_NEXT_KEY] = bool(response.get("next"))
+    return response.get("results", [])
+
+
+async def find_task(manager: DialogManager, api: BackendAPI, task_id: str) -> dict[str, Any] | None:
+    """
+    Ищет задачу на текущей странице по id.
+
+    Обработчики выбора задачи берут её отсюда, а не из `dialog_data`, поэтому
+    задачи целиком не попадают в хранилище FSM; обычно страница уже в кэше.
+
+    Args:
+        manager (DialogManager): Менеджер текущего диалога.
+        api (BackendAPI): Клиент бэкенда.
+        task_id (str): Идентификатор задачи.
+
+    Returns:
+        dict[str, Any] | None: Задача или None, если на странице её нет.
+
+    Raises:
+        BackendError: Если бэкенд вернул ошибку.
+    """
+    tasks = await get_tasks_cached(manager, api)
+    return next((task for task in tasks if str(task.get("id")) == task_id), None)
+
+
+def tasks_pager_data(manager: DialogManager) -> dict[str, Any]:
+    """
+    Возвращает данные для кнопок листания задач по последней загруженной странице.
+
+    Вызывается из геттера окна после `get_tasks_cached`.
+
+    Args:
+        manager (DialogManager): Менеджер текущего диалога.
+
+    Returns:
+        dict[str, Any]: Словарь с ключами "tasks_page", "tasks_has_prev" и "tasks_has_next".
+    """
+    page: int = manager.dialog_data.get(_TASKS_PAGE_KEY, 1)
+    return {
+        "tasks_page": page,
+        "tasks_has_prev": page > 1,
+        "tasks_has_next": manager.dialog_data.get(_TASKS_HAS_NEXT_KEY, False),
+    }
+
+
+def change_tasks_page(manager: DialogManager, delta: int) -> None:
+    """
+    Сдвигает текущую страницу задач; новая страница загрузится при перерисовке окна.
+
+    Args:
+        manager (DialogManager): Менеджер текущего диалога.
+        delta (int): На сколько страниц сдвинуться.
+    """
+    page: int = manager.dialog_data.get(_TASKS_PAGE_KEY, 1)
+    manager.dialog_data[_TASKS_PAGE_KEY] = max(1, page + delta)
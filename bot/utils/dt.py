@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from dateutil import tz
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 from core.config import settings
 
+# Те же форматы, что принимал strptime: "%d.%m.%Y %H:%M" и "%Y-%m-%d %H:%M".
+# re.ASCII: без него \d принимает любые Unicode-цифры (например, арабские), которые strptime отвергал.
+_DMY_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})\s+(\d{1,2}):(\d{1,2})", re.ASCII)
+_YMD_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2})", re.ASCII)
+_FORMAT_ERROR = "Неверный формат. Пример: 31.12.2025 14:30"
+# Часовой пояс пользователя задаётся настройками и не меняется, поэтому ищется один раз.
+_LOCAL_TZ = ZoneInfo(settings.user_tz)
 
+
+@lru_cache(maxsize=1024)
 def parse_user_datetime(text: str) -> datetime:
     """
     Парсит строку с датой и временем, приводя её к объекту datetime в UTC.
 
+    Результат кэшируется по исходной строке: формат и часовой пояс фиксированы,
+    а datetime неизменяем. Ошибки разбора не кэшируются.
+
     Args:
         text (str): Строка с датой и временем.
 
@@ -22,21 +36,29 @@ def parse_user_datetime(text: str) -> datetime:
         ValueError: Если строка не соответствует ожидаемым форматам.
     """
     text = text.strip()
-    local_tz = tz.gettz(settings.user_tz)
-    for fmt in ("%d.%m.%Y %H:%M", "%Y-%m-%d %H:%M"):
-        try:
-            dt_naive = datetime.strptime(text, fmt)
-            dt_local = dt_naive.replace(tzinfo=local_tz)
-            return dt_local.astimezone(tz.UTC)
-        except ValueError:
-            continue
-    raise ValueError("Неверный формат. Пример: 31.12.2025 14:30")
+    if match := _DMY_RE.fullmatch(text):
+        day, month, year, hour, minute = match.groups()
+    elif match := _YMD_RE.fullmatch(text):
+        year, month, day, hour, minute = match.groups()
+    else:
+        raise ValueError(_FORMAT_ERROR)
+    try:
+        dt_local = datetime(
+            int(year), int(month), int(day), int(hour), int(minute), tzinfo=_LOCAL_TZ
+        )
+    except ValueError:
+        raise ValueError(_FORMAT_ERROR) from None
+    return dt_local.astimezone(timezone.utc)
 
 
+@lru_cache(maxsize=1024)
 def format_dt_user(dt_iso: str | None) -> str:
     """
     Форматирует дату и время в строку в локальной временной зоне пользователя.
 
+    Результат кэшируется по ISO-строке: окна диалогов перерисовывают один и тот же
+    срок многократно, а разбор ISO и перевод в часовой пояс повторять незачем.
+
     Args:
         dt_iso (str | None): Дата и время в формате ISO 8601 или None.
 
@@ -45,6 +67,5 @@ def format_dt_user(dt_iso: str | None) -> str:
     """
     if not dt_iso:
         return "-"
-    local_tz = tz.gettz(settings.user_tz)
     dt = datetime.fromisoformat(dt_iso.replace("Z", "+00:00"))
-    return dt.astimezone(local_tz).strftime("%d.%m.%Y %H:%M")
+    return dt.astimezone(_LOCAL_TZ).strftime("%d.%m.%Y %H:%M")
@@ -3,28 +3,34 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
 from textwrap import shorten
-from typing import Any, TypeAlias
+from typing import Any, Final, TypeAlias
 
 from utils.dt import format_dt_user
 
 DESCRIPTION_SHORT_LENGTH = 160
 TAG_DISPLAY_LIMIT = 5
 
-STATUS_PRESENTATION: Mapping[str, tuple[str, str]] = {
+STATUS_PRESENTATION: Final[dict[str, tuple[str, str]]] = {
     "active": ("🟡", "В работе"),
     "done": ("✅", "Готово"),
     "expired": ("⏰", "Просрочено"),
 }
+# Иконка и подпись для пустого или неизвестного статуса.
+STATUS_DEFAULT: Final[tuple[str, str]] = ("⚪️", "Неизвестный статус")
 
 CategoryPayload: TypeAlias = Mapping[str, Any]
 TaskPayload: TypeAlias = Mapping[str, Any]
 
 
+@lru_cache(maxsize=8)
 def _resolve_status(status: str | None) -> tuple[str, str]:
     """
     Определяет и возвращает иконку и метку для заданного статуса.
 
+    Статусов всего несколько, поэтому результат кэшируется по значению статуса.
+
     Args:
         status (str | None): Статус, для которого нужно определить иконку и метку.
             Если значение None, используется статус по умолчанию.
@@ -33,10 +39,7 @@ def _resolve_status(status: str | None) -> tuple[str, str]:
         tuple[str, str]: Кортеж, содержащий иконку и метку статуса.
 
     """
-    default_icon, default_label = "⚪️", "Неизвестный статус"
-    if not status:
-        return default_icon, default_label
-    return STATUS_PRESENTATION.get(status, (default_icon, default_label))
+    return STATUS_PRESENTATION.get(status, STATUS_DEFAULT) if status else STATUS_DEFAULT
 
 
 def _format_tags(categories: Sequence[CategoryPayload] | None) -> str:
@@ -53,25 +56,22 @@ def _format_tags(categories: Sequence[CategoryPayload] | None) -> str:
     if not categories:
         return "—"
 
-    normalized_tags: list[str] = []
-    for category in categories:
-        slug = str(category.get("slug") or "").strip()
-        name = str(category.get("name") or "").strip()
-        tag_value = slug or name
-        if not tag_value:
-            # Пропускаем пустые значения, чтобы не засорять вывод.
-            continue
-        normalized_tags.append(f"#{tag_value}")
-
+    # Пустые значения пропускаем, чтобы не засорять вывод.
+    normalized_tags = [
+        f"#{tag_value}"
+        for category in categories
+        if (
+            tag_value := str(category.get("slug") or "").strip()
+            or str(category.get("name") or "").strip()
+        )
+    ]
     if not normalized_tags:
         return "—"
 
-    if len(normalized_tags) <= TAG_DISPLAY_LIMIT:
+    tags_count = len(normalized_tags)
+    if tags_count <= TAG_DISPLAY_LIMIT:
         return ", ".join(normalized_tags)
-
-    visible_tags = normalized_tags[:TAG_DISPLAY_LIMIT]
-    hidden_count = len(normalized_tags) - TAG_DISPLAY_LIMIT
-    return ", ".join(visible_tags + [f"+{hidden_count}"])
+    return f"{', '.join(normalized_tags[:TAG_DISPLAY_LIMIT])}, +{tags_count - TAG_DISPLAY_LIMIT}"
 
 
 def fmt_task_line(task: TaskPayload) -> str:
@@ -88,26 +88,28 @@ def fmt_task_line(task: TaskPayload) -> str:
     status_raw = task.get("status")
     status_icon, status_label = _resolve_status(status_raw if isinstance(status_raw, str) else None)
     title = str(task.get("title") or "Без названия")
-    description_raw = str(task.get("description") or "").strip()
-    description = (
-        shorten(description_raw, width=DESCRIPTION_SHORT_LENGTH, placeholder="…")
-        if description_raw
-        else ""
-    )
+    # shorten тоже схлопывает пробелы, но каждый раз гоняет TextWrapper с регулярками;
+    # короткому описанию достаточно split/join, результат тот же.
+    description = " ".join(str(task.get("description") or "").split())
+    if len(description) > DESCRIPTION_SHORT_LENGTH:
+        description = shorten(description, width=DESCRIPTION_SHORT_LENGTH, placeholder="…")
     created_at = format_dt_user(task.get("created_at"))
     due_at = format_dt_user(task.get("due_at"))
     categories_raw = task.get("categories_detail")
-    is_sequence = isinstance(categories_raw, Sequence) and not isinstance(categories_raw, (str, bytes))
+    # JSON-массив после декодирования всегда list; проверка по конкретным типам дешевле ABC Sequence.
+    is_sequence = isinstance(categories_raw, (list, tuple))
     categories: Sequence[CategoryPayload] | None = categories_raw if is_sequence else None
     tags = _format_tags(categories)
 
-    lines: list[str] = [f"{status_icon} {status_label}", f"Название: {title}"]
-    if description:
-        lines.append(f"Описание: {description}")
-    lines.append(f"Создана: {created_at}")
-    lines.append(f"Дедлайн: {due_at}")
-    lines.append(f"Теги: {tags}")
-    return "\n".join(lines)
+    description_line = f"Описание: {description}\n" if description else ""
+    return (
+        f"{status_icon} {status_label}\n"
+        f"Название: {title}\n"
+        f"{description_line}"
+        f"Создана: {created_at}\n"
+        f"Дедлайн: {due_at}\n"
+        f"Теги: {tags}"
+    )
 
 
 def fmt_categories_list(cats: Iterable[dict]) -> str:
@@ -122,7 +124,4 @@ def fmt_categories_list(cats: Iterable[dict]) -> str:
         str: Сформированная строка с перечислением категорий или сообщение
             "Нет категорий.", если список пуст.
     """
-    lines = []
-    for c in cats:
-        lines.append(f"• {c['name']} (/{c['slug']})")
-    return "\n".join(lines) if lines else "Нет категорий."
+    return "\n".join(f"• {c['name']} (/{c['slug']})" for c in cats) or "Нет категорий."
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from aiohttp import web
 
+# Ответ проверки состояния постоянен, поэтому тело сериализуется один раз.
+_HEALTH_BODY = b'{"status": "ok"}'
+
 
 async def health(_request: web.Request) -> web.Response:
     """
@@ -15,7 +18,7 @@ async def health(_request: web.Request) -> web.Response:
     Returns:
         web.Response: JSON-ответ с ключом "status" и значением "ok".
     """
-    return web.json_response({"status": "ok"})
+    return web.Response(body=_HEALTH_BODY, content_type="application/json")
 
 
 def make_app() -> web.Application: